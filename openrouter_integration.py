@@ -59,11 +59,20 @@ class TwitterBot:
         self.tweet_queue = queue.Queue()
         self.tweet_count = 0
         self.last_tweet_time = None
-        self.used_stories = set()
-        self.recent_topics = []
-        self.MAX_RECENT_TOPICS = 50
-        self.feed_errors = defaultdict(int)
-        self.feed_last_used = {}
+        self.topic_index = TopicIndex()  # Keywords of recently posted stories
+        self.ranking_weights = dict(RANKING_WEIGHTS)  # Signal weights used to score candidates
+        self.feed_breaker = FeedCircuitBreaker()  # Skips failing/slow feeds, persisted
+        self.feed_poller = FeedPollScheduler()  # Polls each feed as often as it publishes
+        self.feed_errors = self.feed_breaker.failures  # Track feed errors
+        self.feed_last_used = {}  # Track when each feed was last used
+        self.feed_cache = FeedCache()  # Conditional GET validators + parsed entries
+        self.story_store = StoryStore()  # Ingested stories, survives restarts
+        self.used_stories = UsedStoryLog(self.story_store)  # Posted story fingerprints, survives restarts
+        self.arxiv = ArxivClient()  # Batched arXiv queries + paper cache
+        self.article_cache = TTLCache(ARTICLE_CACHE_SIZE, ARTICLE_CACHE_TTL)  # url -> extracted text
+        self.story_pools = {}  # subject -> ranked candidates kept warm by the prefetcher
+        self.story_pool_lock = threading.Lock()
+        self.prefetcher_running = False
         self.last_successful_tweet = None
         self.twitter_client = None
         self.backoff_until = None
@@ -89,9 +98,16 @@ class TwitterBot:
         self.characters = self.load_characters()
         print(f"Loaded characters: {json.dumps(self.characters, indent=2)}")
         
+        self.load_custom_feeds()
         self.feed_config = self.load_feed_config()
         print(f"Loaded feed configuration: {json.dumps(self.feed_config, indent=2)}")
-        
+
+        # Seed the topic history from the story store the first time round
+        if not len(self.topic_index):
+            for story in reversed(self.story_store.recent_used(TOPIC_HISTORY_SIZE)):
+                self.topic_index.add(self.extract_keywords(f"{story['title']} {story['preview']}"))
+        print(f"Restored {len(self.used_stories)} recently used stories")
+
         self.openrouter_models = self.load_openrouter_models()
         print(f"Loaded OpenRouter models: {json.dumps(self.openrouter_models, indent=2)}")
         
@@ -218,16 +234,20 @@ class TwitterBot:
                 else:
                     return "Monthly tweet limit reached. Please wait for the next cycle."
 
-            # Extract URL if present in the topic
-            url_match = re.search(r'Read more: (https?://\S+)', topic)
-            article_url = url_match.group(1) if url_match else None
-            
-            # Remove the "Read more: URL" part from the topic
-            clean_topic = re.sub(r'\n\nRead more: https?://\S+', '', topic)
+            if isinstance(topic, CryptoArticle):
+                # Stories from the feeds already carry their URL
+                article_url = topic.link
+                clean_topic = topic.get_topic_text()
+            else:
+                # Extract URL if present in the topic
+                url_match = re.search(r'Read more: (https?://\S+)', topic)
+                article_url = url_match.group(1) if url_match else None
 
-            # Calculate character limit
-            TWITTER_SHORT_URL_LENGTH = 24
-            max_content_length = 280 - TWITTER_SHORT_URL_LENGTH if article_url else 280
+                # Remove the "Read more: URL" part from the topic
+                clean_topic = re.sub(r'\n\nRead more: https?://\S+', '', topic)
+
+            # Calculate character limit (weighted, as X counts it; the URL goes after a space)
+            max_content_length = TWEET_MAX_WEIGHTED_LENGTH - (TWEET_URL_LENGTH + 1 if article_url else 0)
 
             # Add variation to prompt tone
             prompt_variants = [
@@ -275,25 +295,25 @@ class TwitterBot:
             # Get the appropriate client
             api_client = self.get_client_for_model(model_info)
             
+            # Ask for several drafts in one call and keep the best one that fits
             response = api_client.chat.completions.create(
                 model=model_name,
                 messages=messages,
                 max_tokens=200,
                 temperature=1.0,
                 presence_penalty=0.6,
-                frequency_penalty=0.6
+                frequency_penalty=0.6,
+                n=TWEET_CANDIDATES
             )
+            candidates = [_clean_tweet_text(choice.message.content) for choice in response.choices]
+            tweet_text = _pick_tweet(candidates, max_content_length)
+            if tweet_text is None:
+                # No draft fits: shorten them locally and keep the longest result
+                tweet_text = max((_shorten_tweet(text, max_content_length) for text in candidates), key=_tweet_length)
 
-            tweet_text = response.choices[0].message.content.strip()
-
-            # Clean up quotation marks if present
-            if tweet_text and len(tweet_text) >= 2:
-                if (tweet_text[0] == '"' and tweet_text[-1] == '"') or \
-                (tweet_text[0] == "'" and tweet_text[-1] == "'"):
-                    tweet_text = tweet_text[1:-1].strip()
-
-            # If tweet content is too long, try one more time with stricter length
-            if len(tweet_text) > max_content_length:
+            # Last resort: a second call, only when no draft can be shortened to a whole clause
+            if not tweet_text:
+                print(f"⚠️ No draft fits in {max_content_length} characters; asking for a shorter one")
                 retry_messages = [
                     {"role": "system", "content": character['prompt']},
                     {"role": "user", "content": f"{variation}\n\nCreate a SHORTER tweet about this topic, maximum {max_content_length} characters. Be concise but maintain personality. NO hashtags, emojis, or URLs. Topic: {clean_topic}"}
@@ -306,22 +326,15 @@ class TwitterBot:
                     presence_penalty=0.6,
                     frequency_penalty=0.6
                 )
-                tweet_text = response.choices[0].message.content.strip()
-                if tweet_text and len(tweet_text) >= 2:
-                    if (tweet_text[0] == '"' and tweet_text[-1] == '"') or \
-                    (tweet_text[0] == "'" and tweet_text[-1] == "'"):
-                        tweet_text = tweet_text[1:-1].strip()
-
-            # Truncate if still too long
-            if len(tweet_text) > max_content_length:
-                sentences = re.split(r'(?<=[.!?])\s+', tweet_text)
-                truncated_text = ""
-                for sentence in sentences:
-                    if len(truncated_text + sentence) + 1 <= max_content_length:
-                        truncated_text += " " + sentence if truncated_text else sentence
-                    else:
-                        break
-                tweet_text = truncated_text.strip()
+                tweet_text = _clean_tweet_text(response.choices[0].message.content)
+                if _tweet_length(tweet_text) > max_content_length:
+                    shortened = _shorten_tweet(tweet_text, max_content_length)
+                    while not shortened and tweet_text:
+                        # Not even one clause fits: drop words until it does
+                        tweet_text = tweet_text.rsplit(" ", 1)[0] if " " in tweet_text else tweet_text[:-1]
+                        if _tweet_length(tweet_text + "...") <= max_content_length:
+                            shortened = tweet_text + "..."
+                    tweet_text = shortened
 
             # Append the article URL at the end
             if article_url:
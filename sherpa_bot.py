@@ -11,13 +11,26 @@ import os
 from datetime import datetime, timedelta, timezone
 from cryptography.fernet import Fernet
 from pathlib import Path
-import requests
 from bs4 import BeautifulSoup
 import html2text
 import httpx
 import re
 import random
-from collections import defaultdict
+import sqlite3
+import hashlib
+from urllib.parse import urlsplit, urlunsplit, urlencode, parse_qsl, unquote
+from xml.etree import ElementTree
+from email.utils import parsedate_to_datetime
+from collections import defaultdict, OrderedDict
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
+import sys
+import unicodedata
+from contextlib import contextmanager
+import numpy as np
 
 # ------- Add these near your imports -------
 import os, json, time, random
@@ -67,30 +80,121 @@ def _prune_backlog(backlog: list) -> list:
     return kept[:MAX_BACKLOG]
 import random
 
-def get_random_story_all(self):
-    """Pick a random subject and return a story in the same shape as get_new_story()."""
-    subjects = list(RSS_FEEDS.keys())  # e.g. ["crypto", "ai", "tech"]
-    random.shuffle(subjects)
-    for s in subjects:
-        story = self.get_new_story(s)  # normal path for a real subject
-        if story:
-            # (optional) annotate where it came from
-            story.setdefault("source_subject", s)
-            return story
-    return None
-
-
 # Constants
 ENCRYPTION_KEY_FILE = "encryption.key"
 CREDENTIALS_FILE = "encrypted_credentials.bin"
 CHARACTERS_FILE = "encrypted_characters.bin"
 FEED_CONFIG_FILE = "encrypted_feed_config.bin"  # New file for feed selection
+FEED_CACHE_FILE = "feed_cache.json"  # ETag/Last-Modified validators and parsed entries per feed
+STORY_DB_FILE = "stories.db"  # SQLite store of ingested feed entries
+FEED_HEALTH_FILE = "feed_health.json"  # Per-feed circuit breaker state
+FEED_POLL_FILE = "feed_poll.json"  # Learned per-feed polling intervals
+TOPIC_HISTORY_FILE = "topic_history.bin"  # Packed keyword fingerprints of posted stories
+CUSTOM_FEEDS_FILE = "custom_feeds.json"  # Feeds imported from OPML, merged into RSS_FEEDS
 MAX_TWEETS_PER_MONTH = 500
 TWEET_INTERVAL_HOURS = 1.5
 FEED_TIMEOUT = 10  # seconds
+REQUEST_TIMEOUT_FLOOR = 0.1  # seconds; shortest timeout a request is given as a deadline nears
 FEED_ERROR_THRESHOLD = 5  # max consecutive errors before skipping feed
+FEED_SLOW_SECONDS = 6  # a fetch slower than this counts as a failure
+FEED_BREAKER_BASE_COOLDOWN = 300  # seconds a tripped feed is skipped before a probe
+FEED_BREAKER_MAX_COOLDOWN = 6 * 3600  # cap for the exponential cooldown
 MIN_STORIES_PER_FEED = 2  # minimum stories to get from each feed
+LAZY_SECONDARY_FEEDS = True  # only fetch secondary feeds when primaries come up short
+SECONDARY_FRESH_HOURS = 24  # primary stories younger than this count towards MIN_STORIES_PER_FEED
 PRIMARY_FEED_WEIGHT = 2.0  # Weight multiplier for primary sources
+RANKING_WEIGHTS = {  # how much each signal contributes to a candidate's score
+    "recency": 1.0,
+    "source": 0.5,
+    "novelty": 0.75,
+    "coverage": 0.5
+}
+RECENCY_HALF_LIFE_HOURS = 12  # a story's recency score halves every this many hours
+FEED_FETCH_WORKERS = 8  # max feeds fetched at the same time during a sweep
+FEED_PREVIEW_LENGTH = 280  # max characters kept from an entry summary
+STORY_TIME_WINDOWS = (24, 48, 72, 120)  # hours, tried in order of preference
+FEED_MAX_ENTRIES = 50  # stop parsing a feed after this many usable entries
+FEED_STALE_RUN = 3  # stop parsing after this many consecutive entries older than the widest window
+FEED_MAX_BYTES = 5 * 1024 * 1024  # never read more than this from a single feed
+FEED_MIN_POLL_MINUTES = 5  # never poll a feed more often than this
+FEED_MAX_POLL_MINUTES = 360  # always poll a feed at least this often
+FEED_DEFAULT_POLL_MINUTES = 15  # interval for feeds we haven't learned a rhythm for yet
+FEED_POLL_FACTOR = 0.5  # poll at this fraction of a feed's typical publish gap
+FEED_POLL_HISTORY = 20  # recent publish times kept per feed to learn its rhythm
+STORY_RETENTION_DAYS = 14  # drop stored stories older than this
+USED_STORY_TTL_DAYS = 30  # a posted story can't be picked again for this long
+USED_STORY_HISTORY = 5000  # posted stories kept in memory for the dedupe check
+PREFETCH_INTERVAL_MINUTES = FEED_MIN_POLL_MINUTES  # how often the prefetcher refreshes candidate pools
+PREFETCH_POOL_SIZE = 20  # ranked candidates kept warm per subject
+SCHEDULER_STORY_BUDGET = 30  # seconds a scheduled post may spend picking a story
+UI_STORY_BUDGET = 8  # seconds a UI button may spend picking a story
+FETCH_CANCEL_POLL = 0.25  # seconds between checks for a cancelled selection while fetching
+FEED_VALIDATION_WORKERS = 16  # feeds probed at the same time during an OPML import
+FEED_VALIDATION_MIN_DAILY = 0.2  # imported feeds posting less often than this per day are downranked
+TOPIC_HISTORY_SIZE = 2000  # posted stories remembered for near-duplicate checks
+TOPIC_SIMILARITY_THRESHOLD = 0.4  # keyword Jaccard above which a story counts as a repeat
+TOPIC_MAX_KEYWORDS = 48  # keyword IDs kept per story (the smallest hashes, so the same subset every time)
+KEYWORD_PATTERN = re.compile(r'\b\w+\b')
+# Common crypto terms to ignore when tracking topics
+KEYWORD_STOPWORDS = frozenset({
+    'crypto', 'blockchain', 'bitcoin', 'ethereum', 'btc', 'eth',
+    'cryptocurrency', 'cryptocurrencies', 'token', 'tokens', 'defi',
+    'market', 'markets', 'trading', 'price', 'prices'
+})
+MINHASH_BANDS = 30  # LSH bands; with MINHASH_ROWS this puts the candidate cut-off near 0.18,
+MINHASH_ROWS = 2  # well below the 0.4 threshold, so real repeats are rarely missed
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid', 'ref', 'ref_src', 'ref_url',
+    'cmpid', 'ocid', 'ncid', 'guccounter', 'igshid', 'mkt_tok', '_hsenc', '_hsmi',
+    'soc_src', 'soc_trk', 'sr_share', 'source', 'amp', 'outputtype', 'rss'
+}
+# Query parameters a redirect wrapper uses to carry the real destination
+REDIRECT_PARAMS = ('url', 'target', 'dest', 'destination', 'redirect', 'redirect_url')
+# Generic parameters (a search "q", a share "u") only mean a redirect on these wrapper hosts
+REDIRECT_HOST_PARAMS = {
+    'google.com': ('q',),
+    'l.facebook.com': ('u',),
+    'lm.facebook.com': ('u',),
+    'l.instagram.com': ('u',),
+    'l.messenger.com': ('u',),
+    'youtube.com': ('q',),
+    'away.vk.com': ('to',),
+}
+
+# Tweet generation
+TWEET_CANDIDATES = 3  # drafts requested per completion call; the best one that fits is posted
+TWEET_MAX_WEIGHTED_LENGTH = 280  # X's limit, in weighted characters
+TWEET_URL_LENGTH = 23  # every link counts as a t.co link of this length
+# Code point ranges X counts as one character; everything else (CJK, most symbols) counts as two
+TWEET_LIGHT_RANGES = ((0x0000, 0x10FF), (0x2000, 0x200D), (0x2010, 0x201F), (0x2032, 0x2037))
+TWEET_URL_PATTERN = re.compile(r'https?://\S+|\b(?:[a-z0-9-]+\.)+(?:com|org|net|io|co|xyz|ai)(?:/\S*)?', re.I)
+# An emoji, with any skin tone or presentation modifier, and any ZWJ-joined followers; counts as two
+TWEET_EMOJI_PATTERN = re.compile(
+    '(?:[\U0001F1E6-\U0001F1FF]{2}'
+    '|[\u00A9\u00AE\u203C-\u3299\U0001F000-\U0001FAFF][\uFE0F\U0001F3FB-\U0001F3FF]?'
+    '(?:\u200D[\u2600-\u27BF\U0001F000-\U0001FAFF][\uFE0F\U0001F3FB-\U0001F3FF]?)*)'
+)
+# Deterministic rewrites tried, in order, when a draft runs long. Contractions only apply
+# when another word follows: "it is what it is." must not become "it's what it's."
+# Only meaning-preserving rewrites belong here ("let us know", "just in", "rather than" stay)
+TWEET_CONTRACTIONS = [
+    (r'\bdo not\b(?=\s+\w)', "don't"), (r'\bdoes not\b(?=\s+\w)', "doesn't"), (r'\bdid not\b(?=\s+\w)', "didn't"),
+    (r'\bis not\b(?=\s+\w)', "isn't"), (r'\bare not\b(?=\s+\w)', "aren't"), (r'\bwas not\b(?=\s+\w)', "wasn't"),
+    (r'\bwere not\b(?=\s+\w)', "weren't"), (r'\bcannot\b(?=\s+\w)', "can't"), (r'\bcan not\b(?=\s+\w)', "can't"),
+    (r'\bwill not\b(?=\s+\w)', "won't"), (r'\bwould not\b(?=\s+\w)', "wouldn't"), (r'\bshould not\b(?=\s+\w)', "shouldn't"),
+    (r'\bhave not\b(?=\s+\w)', "haven't"), (r'\bhas not\b(?=\s+\w)', "hasn't"), (r'\bI am\b(?=\s+\w)', "I'm"),
+    (r'\byou are\b(?=\s+\w)', "you're"), (r'\bwe are\b(?=\s+\w)', "we're"), (r'\bthey are\b(?=\s+\w)', "they're"),
+    (r'\bit is\b(?=\s+\w)', "it's"), (r'\bthat is\b(?=\s+\w)', "that's"), (r'\bthere is\b(?=\s+\w)', "there's"),
+    (r'\bwhat is\b(?=\s+\w)', "what's"), (r'\bI have\b(?=\s+\w)', "I've"), (r'\bI will\b(?=\s+\w)', "I'll"),
+    (r'\bwe will\b(?=\s+\w)', "we'll"), (r'\byou will\b(?=\s+\w)', "you'll"), (r'\bthey will\b(?=\s+\w)', "they'll"),
+]
+TWEET_FILLER = [
+    (r'\bin order to\b', 'to'), (r'\bdue to the fact that\b', 'because'),
+    (r'\bat this point in time\b', 'now'), (r'\bin the event that\b', 'if'),
+    (r'\b(?:really|very|actually|basically|literally|quite|simply|totally|'
+     r'definitely|truly|honestly|certainly|somewhat)\s+', ''),
+]
 
 # Constants for meme handling
 SUPPORTED_MEME_FORMATS = ('.jpg', '.jpeg', '.png', '.gif')
@@ -122,6 +226,60 @@ DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 }
 
+# Article scraping settings
+ARTICLE_MAX_BYTES = 2 * 1024 * 1024  # stop downloading an article page past this size
+ARTICLE_CACHE_SIZE = 256  # extracted article texts kept in memory
+ARTICLE_CACHE_TTL = 6 * 3600  # seconds an extracted article text stays cached
+
+# lxml (in requirements.txt) is a much faster BeautifulSoup backend; the stdlib parser is a slower fallback
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# HTML/XML parsing can optionally run in worker processes so it doesn't hold the
+# GIL on the scheduler or Gradio threads. Opt-in, and Linux only: workers are
+# forked, which is unsafe on macOS and unavailable on Windows. With the pool off,
+# feeds are parsed in-thread as they stream and downloads stop early.
+PARSE_IN_PROCESSES = False
+PARSE_WORKERS = os.cpu_count() or 1
+
+# arXiv API settings
+ARXIV_API_URL = "http://export.arxiv.org/api/query"
+ARXIV_RESULTS_PER_CATEGORY = 10  # matches the per-category max_results of the old feed URLs
+ARXIV_MIN_INTERVAL = 3  # seconds between API calls, per arXiv's usage guidelines
+ARXIV_CACHE_SIZE = 1000  # paper details kept in memory by paper ID
+ARXIV_NS = {
+    'atom': 'http://www.w3.org/2005/Atom',
+    'arxiv': 'http://arxiv.org/schemas/atom'
+}
+
+# Shared HTTP connection pool settings
+HTTP_MAX_CONNECTIONS = 32  # total open connections across all hosts
+HTTP_MAX_KEEPALIVE = 16  # idle connections kept open for reuse
+HTTP_KEEPALIVE_EXPIRY = 90  # seconds an idle connection stays in the pool
+HTTP_MAX_PER_HOST = 4  # concurrent requests allowed to any single host
+HTTP_CONNECT_TIMEOUT = 5  # seconds
+
+# HTTP/2 is used when the optional h2 package is installed (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Story clustering uses sparse matrices via scipy (in requirements.txt). Without
+# it, a much slower dense NumPy path over a smaller hashed space still works
+try:
+    from scipy import sparse
+    from scipy.sparse.csgraph import connected_components
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+CLUSTER_FEATURES = 2 ** 18 if SCIPY_AVAILABLE else 2 ** 12  # hashed TF-IDF dimensions
+CLUSTER_SIMILARITY = 0.5  # cosine similarity above which two stories cover the same event
+
 # OpenAI Models with limits
 OPENAI_MODELS = {
     "gpt-3.5-turbo (Most affordable)": {
@@ -225,13 +383,1151 @@ def get_random_story_from(categories=None):
     # try up to a few times in case a feed is temporarily empty
     for _ in range(4):
         name, url = random.choice(pool)
-        feed = feedparser.parse(url)
+        feed = feedparser.parse(http_transport.get(url).content)
         if feed.entries:
             entry = random.choice(feed.entries[:10])  # top few items
             title = getattr(entry, "title", "(untitled)")
             link = getattr(entry, "link", "")
             return f"{title} — {link}  \n(source: {name})"
     return None
+
+def _entry_published(entry):
+    """Return a feed entry's publish time as an aware UTC datetime, or None."""
+    parsed = entry.get("published_parsed") or entry.get("updated_parsed")
+    if not parsed:
+        return None
+    return datetime(*parsed[:6], tzinfo=timezone.utc)
+
+def _clean_preview(summary, limit=FEED_PREVIEW_LENGTH):
+    """Strip HTML from an entry summary and trim it to a short preview."""
+    text = BeautifulSoup(summary or "", "html.parser").get_text(" ", strip=True)
+    text = re.sub(r"\s+", " ", text)
+    if len(text) > limit:
+        text = text[:limit].rsplit(" ", 1)[0] + "..."
+    return text
+
+def _parse_feed_entries(content):
+    """Parse a raw RSS/Atom body into JSON-friendly entry dicts."""
+    parsed = feedparser.parse(content)
+    entries = []
+    for entry in parsed.entries:
+        title = (entry.get("title") or "").strip()
+        link = entry.get("link")
+        published = _entry_published(entry)
+        if not title or not link or not published:
+            continue
+        entries.append({
+            "title": title,
+            "preview": _clean_preview(entry.get("summary", "")),
+            "url": link,
+            "published_ts": published.timestamp(),
+        })
+    return entries
+
+def _strip_host_prefixes(host):
+    """Drop www./amp./m. prefixes, however they are stacked (amp.www.x.com -> x.com)."""
+    while True:
+        prefix = next((p for p in ("www.", "amp.", "m.") if host.startswith(p) and "." in host[len(p):]), None)
+        if not prefix:
+            return host
+        host = host[len(prefix):]
+
+def _canonical_url(url):
+    """Normalize a story URL so trivial variants map to the same key.
+
+    Unwraps redirect wrappers and AMP cache links, strips tracking
+    parameters and AMP variants, and ignores case, www., trailing slashes,
+    fragments and query parameter order.
+    """
+    url = (url or "").strip()
+    for _ in range(3):  # wrappers are occasionally nested
+        parts = urlsplit(url)
+        query = parse_qsl(parts.query, keep_blank_values=True)
+        redirect_params = REDIRECT_PARAMS + REDIRECT_HOST_PARAMS.get(_strip_host_prefixes(parts.netloc.lower()), ())
+        target = next(
+            (unquote(value) for key, value in query
+             if key.lower() in redirect_params and re.match(r'https?%3A|https?://', value, re.I)),
+            None
+        )
+        if target and target != url:
+            url = target
+            continue
+        # Google's AMP cache: https://<x>.cdn.ampproject.org/c/s/<host>/<path>
+        match = re.match(r'/[cv](/s)?/(.+)', parts.path) if parts.netloc.lower().endswith('cdn.ampproject.org') else None
+        if match:
+            url = ("https://" if match.group(1) else "http://") + match.group(2)
+            continue
+        break
+
+    parts = urlsplit(url)
+    host = _strip_host_prefixes(parts.netloc.lower())
+    path = re.sub(r'/amp(?=/|$)|\.amp(?=\.html?$|$)', '', parts.path).rstrip("/") or "/"
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    )
+    return urlunsplit((parts.scheme.lower(), host, path, urlencode(query), ""))
+
+def _content_hash(title):
+    """Hash of a normalized headline, for spotting the same story under different URLs."""
+    words = re.findall(r'\w+', (title or "").lower())
+    return hashlib.blake2b(" ".join(words).encode(), digest_size=8).hexdigest()
+
+def _parse_opml(content):
+    """Return {"url", "name"} dicts for every feed outline in an OPML document."""
+    root = ElementTree.fromstring(content)
+    feeds = []
+    seen = set()
+    for outline in root.iter("outline"):
+        url = (outline.get("xmlUrl") or "").strip()
+        if not url or url in seen:
+            continue
+        seen.add(url)
+        name = (outline.get("title") or outline.get("text") or "").strip()
+        feeds.append({"url": url, "name": name or urlsplit(url).netloc})
+    return feeds
+
+def _request_timeout(deadline):
+    """Per-request timeout: FEED_TIMEOUT, shortened to whatever is left before deadline."""
+    if deadline is None:
+        return FEED_TIMEOUT
+    return max(REQUEST_TIMEOUT_FLOOR, min(FEED_TIMEOUT, deadline - time.monotonic()))
+
+def _deadline_hit(deadline):
+    """True once deadline is within the request timeout floor (or has passed)."""
+    return deadline is not None and deadline - time.monotonic() <= REQUEST_TIMEOUT_FLOOR
+
+def _until_deadline(chunks, deadline, cancel=None):
+    """Pass byte chunks through, aborting the download once deadline has passed
+    or the cancel event is set."""
+    for chunk in chunks:
+        if deadline is not None and time.monotonic() >= deadline:
+            raise TimeoutError("story selection deadline reached")
+        if cancel is not None and cancel.is_set():
+            raise TimeoutError("story selection cancelled")
+        yield chunk
+
+def _local_name(tag):
+    """Drop the {namespace} prefix ElementTree puts on tag names."""
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ""
+
+def _parse_feed_date(text):
+    """Parse an RFC 822 (RSS) or ISO 8601 (Atom) date into an epoch timestamp."""
+    if not text:
+        return None
+    for parse in (parsedate_to_datetime, _parse_iso_z):
+        try:
+            parsed = parse(text.strip())
+        except (TypeError, ValueError, IndexError):
+            continue
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed.timestamp()
+    return None
+
+def _stream_entry(elem):
+    """Turn a finished <item>/<entry> element into an entry dict, or None."""
+    fields = {}
+    link = None
+    for child in elem:
+        name = _local_name(child.tag)
+        if name == "link":
+            # Atom links carry the URL in href; RSS links carry it as text
+            if child.get("href") and child.get("rel", "alternate") == "alternate":
+                link = link or child.get("href")
+            elif child.text and child.text.strip():
+                link = link or child.text.strip()
+        elif name not in fields:
+            fields[name] = "".join(child.itertext()).strip()
+
+    title = fields.get("title", "")
+    link = link or (fields.get("guid") if fields.get("guid", "").startswith("http") else None)
+    published_ts = next(
+        (ts for ts in (_parse_feed_date(fields.get(name)) for name in ("pubDate", "published", "updated", "date", "issued")) if ts),
+        None
+    )
+    if not title or not link or not published_ts:
+        return None
+    summary = fields.get("description") or fields.get("summary") or fields.get("encoded") or fields.get("content", "")
+    return {
+        "title": title,
+        "preview": _clean_preview(summary),
+        "url": link,
+        "published_ts": published_ts,
+    }
+
+def _stream_parse_feed(chunks, max_entries=FEED_MAX_ENTRIES, max_age_hours=STORY_TIME_WINDOWS[-1]):
+    """Incrementally parse an RSS 2.0, RSS 1.0 or Atom body from byte chunks.
+
+    Each entry is cleared as soon as it has been read, and reading stops
+    at FEED_MAX_BYTES, after max_entries entries (newest-first feeds), or
+    after FEED_STALE_RUN entries in a row older than max_age_hours once a
+    fresh entry has been kept. Feeds listed oldest first are read through,
+    keeping their newest max_entries entries. Malformed or unrecognised
+    feeds fall back to feedparser on the bytes read so far.
+    """
+    parser = ElementTree.XMLPullParser(events=("start", "end"))
+    cutoff = time.time() - max_age_hours * 3600
+    entries = []
+    buffered = []
+    size = 0
+    stale_run = 0
+    root_name = None
+    malformed = False
+    done = False
+
+    chunks = iter(chunks)
+    for chunk in chunks:
+        size += len(chunk)
+        buffered.append(chunk)
+        try:
+            parser.feed(chunk)
+            for event, elem in parser.read_events():
+                name = _local_name(elem.tag)
+                if event == "start":
+                    root_name = root_name or name
+                    continue
+                if name not in ("item", "entry"):
+                    continue
+                entry = _stream_entry(elem)
+                elem.clear()
+                if entry is None:
+                    continue
+                if entry["published_ts"] < cutoff:
+                    # Only a stale run after fresh entries means the rest is older
+                    stale_run += 1
+                    done = bool(entries) and stale_run >= FEED_STALE_RUN
+                else:
+                    stale_run = 0
+                    entries.append(entry)
+                    if len(entries) > max_entries:
+                        entries.pop(0)  # listed oldest first: keep the newest
+                    # Newest-first feeds can stop once full; oldest-first ones read on
+                    done = len(entries) >= max_entries and entries[-1]["published_ts"] <= entries[0]["published_ts"]
+                if done:
+                    break
+        except ElementTree.ParseError:
+            malformed = True
+        if done or malformed or size >= FEED_MAX_BYTES:
+            break
+
+    if malformed or (not entries and root_name not in ("rss", "feed", "RDF")):
+        # Read whatever is left (still capped) and let feedparser cope with it
+        for chunk in chunks:
+            if size >= FEED_MAX_BYTES:
+                break
+            size += len(chunk)
+            buffered.append(chunk)
+        return _parse_feed_entries(b"".join(buffered))
+    return entries
+
+class FeedCache:
+    """HTTP validators and parsed entries per feed URL, persisted between runs.
+
+    Lets feed fetches send If-None-Match / If-Modified-Since and reuse the
+    previously parsed entries when the server answers 304 Not Modified.
+    """
+    def __init__(self, path=FEED_CACHE_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        self.save_lock = threading.Lock()
+        self.feeds = {}
+        self.dirty = False
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r') as f:
+                    self.feeds = json.load(f)
+                print(f"Loaded feed cache for {len(self.feeds)} feeds")
+            except Exception as e:
+                print(f"Error loading feed cache: {e}")
+                self.feeds = {}
+
+    def conditional_headers(self, url):
+        """Return validator headers for a URL we already hold entries for."""
+        with self.lock:
+            cached = self.feeds.get(url)
+        if not cached or cached.get("entries") is None:
+            return {}
+        headers = {}
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+        return headers
+
+    def get_entries(self, url):
+        with self.lock:
+            cached = self.feeds.get(url)
+        return cached.get("entries") if cached else None
+
+    def store(self, url, etag, last_modified, entries):
+        with self.lock:
+            self.feeds[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "entries": entries,
+                "fetched_at": time.time(),
+            }
+            self.dirty = True
+
+    def save(self):
+        """Write the cache to disk if anything changed since the last save."""
+        with self.lock:
+            if not self.dirty:
+                return
+            snapshot = json.dumps(self.feeds)
+            self.dirty = False
+        # Concurrent sweeps share the temp file, so write one at a time
+        with self.save_lock:
+            try:
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, 'w') as f:
+                    f.write(snapshot)
+                os.replace(tmp_path, self.path)
+            except Exception as e:
+                print(f"Error saving feed cache: {e}")
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after ttl seconds."""
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.items = OrderedDict()
+
+    def get(self, key, default=None):
+        with self.lock:
+            item = self.items.get(key)
+            if item is None:
+                return default
+            value, expires = item
+            if time.monotonic() >= expires:
+                del self.items[key]
+                return default
+            self.items.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self.lock:
+            self.items[key] = (value, time.monotonic() + self.ttl)
+            self.items.move_to_end(key)
+            while len(self.items) > self.maxsize:
+                self.items.popitem(last=False)
+
+def _extract_article_text(content):
+    """Strip scripts and styles from an HTML page and return its visible text."""
+    soup = BeautifulSoup(content, HTML_PARSER)
+    for script in soup(["script", "style"]):
+        script.decompose()
+    return soup.get_text(separator='\n', strip=True)
+
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+
+def start_parse_pool():
+    """Create the parsing process pool and fork its workers.
+
+    Call this at startup before other threads exist, so workers are forked
+    from a quiet process.
+    """
+    global _parse_pool
+    if not PARSE_IN_PROCESSES or not sys.platform.startswith("linux"):
+        return None
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=PARSE_WORKERS,
+                mp_context=multiprocessing.get_context("fork")
+            )
+            # With fork, the first submit launches every worker at once
+            _parse_pool.submit(int).result()
+            print(f"Started parsing pool with {PARSE_WORKERS} worker processes")
+        return _parse_pool
+
+def run_parser(func, *args):
+    """Run a CPU-bound parser in the process pool if start_parse_pool() created one, otherwise inline.
+
+    func must be a module-level function taking raw bytes and returning a
+    small picklable result.
+    """
+    global _parse_pool
+    # Never fork from here: the pool only exists if start_parse_pool() ran at startup
+    pool = _parse_pool
+    if pool is None:
+        return func(*args)
+    try:
+        return pool.submit(func, *args).result()
+    except BrokenProcessPool:
+        print("Parsing pool broke; parsing in-thread from now on")
+        with _parse_pool_lock:
+            _parse_pool = None
+        return func(*args)
+
+def _parse_feed_body(content):
+    """Parse a complete feed body; process-pool entry point for _stream_parse_feed."""
+    return _stream_parse_feed([content])
+
+# Time the current thread's fetch spent queued (waiting for a host slot or the
+# arXiv call spacing), so feed health only counts time the feed itself took
+_queue_time = threading.local()
+
+def _add_queue_time(seconds):
+    _queue_time.seconds = getattr(_queue_time, "seconds", 0.0) + seconds
+
+def _take_queue_time():
+    """Return and reset the queued time accumulated on this thread."""
+    seconds = getattr(_queue_time, "seconds", 0.0)
+    _queue_time.seconds = 0.0
+    return seconds
+
+class HttpTransport:
+    """One keep-alive connection pool shared by every outbound HTTP call.
+
+    Feeds, article scrapes, arXiv lookups, Telegram and the X v2 API all go
+    through the same httpx client, so repeated calls to a host reuse an open
+    TCP+TLS connection instead of handshaking again. Each host also gets a
+    small semaphore so one slow site can't hog the whole pool.
+    """
+    def __init__(self, http2=HTTP2_AVAILABLE):
+        self.client = httpx.Client(
+            http2=http2,
+            headers=DEFAULT_HEADERS,
+            follow_redirects=True,
+            timeout=httpx.Timeout(FEED_TIMEOUT, connect=HTTP_CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+            )
+        )
+        self.lock = threading.Lock()
+        self.host_slots = {}
+
+    def _host_slot(self, url):
+        host = urlsplit(url).netloc.lower()
+        with self.lock:
+            if host not in self.host_slots:
+                self.host_slots[host] = threading.BoundedSemaphore(HTTP_MAX_PER_HOST)
+            return self.host_slots[host]
+
+    @contextmanager
+    def _hold_host_slot(self, url):
+        slot = self._host_slot(url)
+        started = time.monotonic()
+        with slot:
+            _add_queue_time(time.monotonic() - started)
+            yield
+
+    def request(self, method, url, **kwargs):
+        with self._hold_host_slot(url):
+            return self.client.request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    @contextmanager
+    def stream(self, method, url, **kwargs):
+        """Stream a response body; the host slot is held until the block exits."""
+        with self._hold_host_slot(url):
+            with self.client.stream(method, url, **kwargs) as response:
+                yield response
+
+http_transport = HttpTransport()
+
+def _arxiv_category(url):
+    """Return the category of an arXiv API category-poll URL, or None."""
+    match = re.match(r'https?://export\.arxiv\.org/api/query\?search_query=cat:([\w.\-]+)', url or "")
+    return match.group(1) if match else None
+
+def _arxiv_base_id(paper_id):
+    """Strip the version suffix so 2401.01234v2 and 2401.01234 share a cache slot."""
+    return re.sub(r'v\d+$', '', paper_id)
+
+def _parse_arxiv_feed(content):
+    """Parse an arXiv API Atom response into paper detail dicts."""
+    root = ElementTree.fromstring(content)
+    papers = []
+    for entry in root.findall('atom:entry', ARXIV_NS):
+        entry_id = (entry.findtext('atom:id', '', ARXIV_NS) or '').strip()
+        paper_id = entry_id.split('/abs/')[-1]
+        if not paper_id:
+            continue
+
+        links = entry.findall('atom:link', ARXIV_NS)
+        html_url = next((link.get('href') for link in links if link.get('type') == 'text/html'), None)
+        if not html_url:
+            # Construct HTML URL from paper ID
+            html_url = f"https://arxiv.org/abs/{paper_id}"
+
+        published = entry.findtext('atom:published', '', ARXIV_NS) or entry.findtext('atom:updated', '', ARXIV_NS)
+        primary = entry.find('arxiv:primary_category', ARXIV_NS)
+        papers.append({
+            'title': re.sub(r'\s+', ' ', entry.findtext('atom:title', '', ARXIV_NS)).strip(),
+            'abstract': (entry.findtext('atom:summary', '', ARXIV_NS) or '').strip(),
+            'authors': [author.findtext('atom:name', '', ARXIV_NS) for author in entry.findall('atom:author', ARXIV_NS)],
+            'categories': [cat.get('term') for cat in entry.findall('atom:category', ARXIV_NS)],
+            'primary_category': primary.get('term') if primary is not None else None,
+            'html_url': html_url,
+            'paper_id': paper_id,
+            'published_ts': _parse_iso_z(published).timestamp() if published else None,
+        })
+    return papers
+
+class ArxivClient:
+    """Batched access to the arXiv API with a paper-ID cache.
+
+    Category polls are collapsed into one OR'd search_query request and
+    paper details are looked up many at a time with id_list=. Calls are
+    spaced ARXIV_MIN_INTERVAL apart to stay well under arXiv's throttling.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.cache = OrderedDict()
+        self.last_call = 0.0
+
+    def _query(self, params, timeout=FEED_TIMEOUT):
+        # Reserve the next call slot under the lock, then wait for it outside
+        # the lock so cache lookups aren't blocked meanwhile
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.last_call + ARXIV_MIN_INTERVAL)
+            wait = slot - now
+            if wait >= timeout:
+                raise TimeoutError("next arXiv call slot is past the deadline")
+            self.last_call = slot
+        if wait > 0:
+            _add_queue_time(wait)
+            time.sleep(wait)
+        response = http_transport.get(f"{ARXIV_API_URL}?{urlencode(params)}", timeout=timeout - wait)
+        response.raise_for_status()
+        papers = run_parser(_parse_arxiv_feed, response.content)
+        self._remember(papers)
+        return papers
+
+    def _remember(self, papers):
+        with self.lock:
+            for paper in papers:
+                key = _arxiv_base_id(paper['paper_id'])
+                self.cache[key] = paper
+                self.cache.move_to_end(key)
+            while len(self.cache) > ARXIV_CACHE_SIZE:
+                self.cache.popitem(last=False)
+
+    def search_categories(self, categories, per_category, deadline=None):
+        """Newest papers across several categories, per_category of each where available.
+
+        All categories share one OR'd request. Busy categories can fill that
+        batch on their own, so while it comes back full the categories it
+        left short are asked for again together: a low-volume category costs
+        an extra (rate-limited) call instead of going unseen. If the deadline
+        cuts a follow-up short, the papers already fetched are returned.
+        """
+        papers = []
+        remaining = list(categories)
+        while remaining:
+            max_results = per_category * len(remaining)
+            try:
+                batch = self._query({
+                    'search_query': ' OR '.join(f"cat:{category}" for category in remaining),
+                    'sortBy': 'lastUpdatedDate',
+                    'sortOrder': 'descending',
+                    'max_results': max_results,
+                }, timeout=_request_timeout(deadline))
+            except (TimeoutError, httpx.TimeoutException):
+                if not papers:
+                    raise
+                print(f"⏱️ arXiv follow-up for {', '.join(remaining)} ran out of time")
+                break
+            papers.extend(batch)
+            if len(batch) < max_results:
+                break  # every matching paper came back
+            counts = defaultdict(int)
+            for paper in batch:
+                for category in set(paper['categories']):
+                    counts[category] += 1
+            remaining = [category for category in remaining if counts[category] < per_category]
+        return papers
+
+    def get_details(self, paper_ids):
+        """Return {paper_id: details}, fetching every uncached ID in one id_list call."""
+        details = {}
+        missing = []
+        with self.lock:
+            for paper_id in paper_ids:
+                cached = self.cache.get(_arxiv_base_id(paper_id))
+                if cached:
+                    details[paper_id] = cached
+                else:
+                    missing.append(paper_id)
+        if missing:
+            fetched = {
+                _arxiv_base_id(paper['paper_id']): paper
+                for paper in self._query({'id_list': ','.join(missing), 'max_results': len(missing)})
+            }
+            for paper_id in missing:
+                if _arxiv_base_id(paper_id) in fetched:
+                    details[paper_id] = fetched[_arxiv_base_id(paper_id)]
+        return details
+
+class FeedCircuitBreaker:
+    """Per-feed circuit breaker so dead or slow feeds stop costing sweep time.
+
+    closed: the feed is fetched normally. After FEED_ERROR_THRESHOLD
+    consecutive failures it goes open and is skipped for a cooldown. Once the
+    cooldown passes it goes half_open and a single probe fetch is allowed:
+    success closes it again, failure reopens it with the cooldown doubled.
+    """
+    def __init__(self, path=FEED_HEALTH_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        self.save_lock = threading.Lock()
+        self.feeds = {}
+        self.failures = defaultdict(int)
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r') as f:
+                    self.feeds = json.load(f)
+                for url, health in self.feeds.items():
+                    self.failures[url] = health.get("failures", 0)
+                    # A probe can't still be in flight after a restart
+                    health["probing"] = False
+                print(f"Loaded circuit breaker state for {len(self.feeds)} feeds")
+            except Exception as e:
+                print(f"Error loading feed health: {e}")
+                self.feeds = {}
+
+    def _health(self, url):
+        return self.feeds.setdefault(url, {
+            "state": "closed",
+            "failures": 0,
+            "cooldown": FEED_BREAKER_BASE_COOLDOWN,
+            "open_until": 0,
+            "probing": False,
+        })
+
+    def allow(self, url):
+        """Return True if the feed should be fetched in this sweep."""
+        with self.lock:
+            health = self._health(url)
+            if health["state"] == "closed":
+                return True
+            if health["state"] == "open":
+                if time.time() < health["open_until"]:
+                    return False
+                health["state"] = "half_open"
+            if health["probing"]:
+                return False
+            health["probing"] = True
+            print(f"🔌 Probing feed {url} after cooldown")
+            return True
+
+    def release(self, url):
+        """Give back a probe slot for a fetch that was abandoned before it finished."""
+        with self.lock:
+            self._health(url)["probing"] = False
+
+    def record_success(self, url, elapsed):
+        if elapsed > FEED_SLOW_SECONDS:
+            print(f"🐢 Feed {url} took {elapsed:.1f}s")
+            self.record_failure(url)
+            return
+        with self.lock:
+            health = self._health(url)
+            if health["state"] != "closed":
+                print(f"✅ Feed {url} recovered")
+            health.update(state="closed", failures=0, cooldown=FEED_BREAKER_BASE_COOLDOWN, probing=False)
+            self.failures[url] = 0
+
+    def record_failure(self, url):
+        with self.lock:
+            health = self._health(url)
+            health["failures"] += 1
+            self.failures[url] = health["failures"]
+            if health["state"] == "half_open":
+                health["cooldown"] = min(health["cooldown"] * 2, FEED_BREAKER_MAX_COOLDOWN)
+            elif health["failures"] < FEED_ERROR_THRESHOLD:
+                return
+            health.update(state="open", open_until=time.time() + health["cooldown"], probing=False)
+            print(f"⛔ Feed {url} tripped; skipping for {health['cooldown'] / 60:.0f} minutes")
+
+    def save(self):
+        with self.lock:
+            snapshot = json.dumps(self.feeds, indent=2)
+        # Sweeps run concurrently; write one at a time and swap the file in whole
+        with self.save_lock:
+            try:
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, 'w') as f:
+                    f.write(snapshot)
+                os.replace(tmp_path, self.path)
+            except Exception as e:
+                print(f"Error saving feed health: {e}")
+
+class FeedPollScheduler:
+    """Learns how often each feed publishes and only polls it when it's due.
+
+    The interval is FEED_POLL_FACTOR times the median gap between the feed's
+    recent entry timestamps, clamped to [FEED_MIN_POLL_MINUTES,
+    FEED_MAX_POLL_MINUTES]. An arXiv category that updates daily ends up
+    polled every few hours; a busy news site every few minutes.
+    """
+    def __init__(self, path=FEED_POLL_FILE):
+        self.path = path
+        self.lock = threading.Lock()
+        self.save_lock = threading.Lock()
+        self.feeds = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r') as f:
+                    self.feeds = json.load(f)
+                print(f"Loaded polling intervals for {len(self.feeds)} feeds")
+            except Exception as e:
+                print(f"Error loading feed poll state: {e}")
+                self.feeds = {}
+
+    def is_due(self, url):
+        with self.lock:
+            poll = self.feeds.get(url)
+        return not poll or time.time() >= poll["next_poll"]
+
+    def record_poll(self, url, published_timestamps):
+        """Fold a poll's entry timestamps into the feed's history and schedule the next poll."""
+        with self.lock:
+            poll = self.feeds.setdefault(url, {"published": [], "interval": FEED_DEFAULT_POLL_MINUTES * 60})
+            seen = sorted(set(poll["published"]) | set(published_timestamps))[-FEED_POLL_HISTORY:]
+            poll["published"] = seen
+            gaps = sorted(b - a for a, b in zip(seen, seen[1:]))
+            if gaps:
+                typical_gap = gaps[len(gaps) // 2]
+                poll["interval"] = min(
+                    max(typical_gap * FEED_POLL_FACTOR, FEED_MIN_POLL_MINUTES * 60),
+                    FEED_MAX_POLL_MINUTES * 60
+                )
+            poll["next_poll"] = time.time() + poll["interval"]
+
+    def save(self):
+        with self.lock:
+            snapshot = json.dumps(self.feeds)
+        # Sweeps run concurrently; write one at a time and swap the file in whole
+        with self.save_lock:
+            try:
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, 'w') as f:
+                    f.write(snapshot)
+                os.replace(tmp_path, self.path)
+            except Exception as e:
+                print(f"Error saving feed poll state: {e}")
+
+class StoryStore:
+    """On-disk store of feed entries, ingested incrementally.
+
+    Backed by SQLite in WAL mode so the scheduler and UI threads can read
+    while a sweep writes. Story selection is an indexed query on subject and
+    publish time instead of a full network sweep.
+
+    Entries are collapsed at ingest time: a URL whose canonical form is
+    already stored is ignored, and one whose headline hash matches a stored
+    story becomes an alias of it, bumping that story's coverage count.
+    """
+    def __init__(self, path=STORY_DB_FILE):
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        with self.lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS stories (
+                    canonical_url TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    subject TEXT NOT NULL,
+                    source TEXT,
+                    feed_url TEXT,
+                    tier TEXT,
+                    title TEXT NOT NULL,
+                    preview TEXT,
+                    published_ts REAL NOT NULL,
+                    ingested_ts REAL NOT NULL,
+                    used_ts REAL,
+                    content_hash TEXT,
+                    coverage INTEGER NOT NULL DEFAULT 1
+                )
+            """)
+            columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(stories)")}
+            if "content_hash" not in columns:
+                self.conn.execute("ALTER TABLE stories ADD COLUMN content_hash TEXT")
+                self.conn.execute("ALTER TABLE stories ADD COLUMN coverage INTEGER NOT NULL DEFAULT 1")
+                self.conn.executemany(
+                    "UPDATE stories SET content_hash = ? WHERE canonical_url = ?",
+                    [(_content_hash(row["title"]), row["canonical_url"])
+                     for row in self.conn.execute("SELECT canonical_url, title FROM stories")]
+                )
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_stories_subject_published ON stories (subject, published_ts)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_stories_published ON stories (published_ts)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_stories_source ON stories (source)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_stories_feed_url ON stories (feed_url)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_stories_used ON stories (used_ts)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_stories_content ON stories (subject, content_hash)")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS story_aliases (
+                    canonical_url TEXT PRIMARY KEY,
+                    story_url TEXT NOT NULL
+                )
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS used_stories (
+                    canonical_url TEXT PRIMARY KEY,
+                    used_ts REAL NOT NULL
+                )
+            """)
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_used_stories_used ON used_stories (used_ts)")
+            # Carry over stories marked used before the dedupe table existed
+            self.conn.execute("""
+                INSERT OR IGNORE INTO used_stories (canonical_url, used_ts)
+                SELECT canonical_url, used_ts FROM stories WHERE used_ts IS NOT NULL
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS sweeps (
+                    subject TEXT PRIMARY KEY,
+                    swept_ts REAL NOT NULL
+                )
+            """)
+
+    def ingest(self, subject, stories):
+        """Insert stories not seen before; returns how many were new."""
+        now = time.time()
+        added = 0
+        with self.lock, self.conn:
+            for story in stories:
+                known = self.conn.execute(
+                    "SELECT 1 FROM stories WHERE canonical_url = ? UNION ALL "
+                    "SELECT 1 FROM story_aliases WHERE canonical_url = ?",
+                    (story.canonical_url, story.canonical_url)
+                ).fetchone()
+                if known:
+                    continue
+
+                # Same headline under another URL around the same time: fold it into
+                # the stored story, unless that one was already posted (recurring
+                # headlines like "Daily Market Wrap" must still come through)
+                content_hash = _content_hash(story.title)
+                match = self.conn.execute("""
+                    SELECT canonical_url FROM stories
+                    WHERE subject = ? AND content_hash = ? AND ABS(published_ts - ?) < ?
+                      AND used_ts IS NULL
+                      AND canonical_url NOT IN (SELECT canonical_url FROM used_stories)
+                    LIMIT 1
+                """, (subject, content_hash, story.published_ts, STORY_TIME_WINDOWS[0] * 3600)).fetchone()
+                if match:
+                    self.conn.execute(
+                        "INSERT INTO story_aliases (canonical_url, story_url) VALUES (?, ?)",
+                        (story.canonical_url, match["canonical_url"])
+                    )
+                    self.conn.execute(
+                        "UPDATE stories SET coverage = coverage + 1 WHERE canonical_url = ?",
+                        (match["canonical_url"],)
+                    )
+                    continue
+
+                self.conn.execute("""
+                    INSERT INTO stories
+                        (canonical_url, url, subject, source, feed_url, tier, title, preview,
+                         published_ts, ingested_ts, content_hash)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    story.canonical_url, story.link, subject, story.source,
+                    story.feed_url, story.tier, story.title, story.preview,
+                    story.published_ts, now, content_hash
+                ))
+                added += 1
+        return added
+
+    def _candidate_filter(self, subject, max_age_hours, feed_urls):
+        query = """
+            WHERE subject = ? AND published_ts >= ? AND used_ts IS NULL
+              AND canonical_url NOT IN (SELECT canonical_url FROM used_stories)
+        """
+        params = [subject, time.time() - max_age_hours * 3600]
+        if feed_urls is not None:
+            feed_urls = list(feed_urls)
+            query += f" AND feed_url IN ({','.join('?' * len(feed_urls))})"
+            params.extend(feed_urls)
+        return query, params
+
+    def count_candidates(self, subject, max_age_hours, feed_urls=None):
+        """Number of unused stories for a subject within max_age_hours."""
+        query, params = self._candidate_filter(subject, max_age_hours, feed_urls)
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM stories " + query, params).fetchone()[0]
+
+    def candidates(self, subject, max_age_hours, feed_urls=None):
+        """Unused stories for a subject within max_age_hours, newest first."""
+        query, params = self._candidate_filter(subject, max_age_hours, feed_urls)
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT * FROM stories " + query + " ORDER BY published_ts DESC", params
+            ).fetchall()
+        return [
+            CryptoArticle(
+                row["title"], row["preview"], None, row["url"], row["published_ts"],
+                source=row["source"], feed_url=row["feed_url"], tier=row["tier"], subject=subject,
+                coverage=row["coverage"]
+            )
+            for row in rows
+        ]
+
+    def mark_used(self, url, used_ts=None):
+        used_ts = used_ts or time.time()
+        canonical = _canonical_url(url)
+        with self.lock, self.conn:
+            self.conn.execute(
+                "UPDATE stories SET used_ts = ? WHERE canonical_url = ?",
+                (used_ts, canonical)
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO used_stories (canonical_url, used_ts) VALUES (?, ?)",
+                (canonical, used_ts)
+            )
+
+    def used_since(self, since, limit):
+        """(canonical_url, used_ts) of stories posted after since, oldest first."""
+        with self.lock:
+            rows = self.conn.execute("""
+                SELECT canonical_url, used_ts FROM (
+                    SELECT canonical_url, used_ts FROM used_stories
+                    WHERE used_ts >= ? ORDER BY used_ts DESC LIMIT ?
+                ) ORDER BY used_ts
+            """, (since, limit)).fetchall()
+        return [(row['canonical_url'], row['used_ts']) for row in rows]
+
+    def recent_used(self, limit):
+        """Most recently posted stories, newest first."""
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT url, title, preview FROM stories WHERE used_ts IS NOT NULL ORDER BY used_ts DESC LIMIT ?",
+                (limit,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def record_sweep(self, subject):
+        """Remember when a subject was last swept and drop expired stories."""
+        now = time.time()
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO sweeps (subject, swept_ts) VALUES (?, ?)",
+                (subject, now)
+            )
+            self.conn.execute(
+                "DELETE FROM stories WHERE published_ts < ? AND used_ts IS NULL",
+                (now - STORY_RETENTION_DAYS * 86400,)
+            )
+            self.conn.execute(
+                "DELETE FROM used_stories WHERE used_ts < ?",
+                (now - USED_STORY_TTL_DAYS * 86400,)
+            )
+            self.conn.execute(
+                "DELETE FROM story_aliases WHERE story_url NOT IN (SELECT canonical_url FROM stories)"
+            )
+
+class UsedStoryLog:
+    """Posted-story dedupe set with true recency eviction.
+
+    Fingerprints live in an OrderedDict, oldest first, so membership checks
+    are O(1) and eviction drops the oldest story rather than an arbitrary
+    one. Every add is written through to the story store's used_stories
+    table, which reloads the log on restart and expires rows past the TTL.
+    """
+    def __init__(self, store, capacity=USED_STORY_HISTORY, ttl_days=USED_STORY_TTL_DAYS):
+        self.store = store
+        self.capacity = capacity
+        self.ttl = ttl_days * 86400
+        self.used = OrderedDict()  # fingerprint -> used_ts, oldest first
+        self.lock = threading.Lock()
+        for url, used_ts in store.used_since(time.time() - self.ttl, capacity):
+            self.used[_story_fingerprint(url)] = used_ts
+
+    def __contains__(self, fingerprint):
+        with self.lock:
+            used_ts = self.used.get(fingerprint)
+            return used_ts is not None and time.time() - used_ts < self.ttl
+
+    def __len__(self):
+        return len(self.used)
+
+    def add(self, story):
+        """Record a story as posted, in memory and on disk"""
+        used_ts = time.time()
+        with self.lock:
+            self.used[story.fingerprint] = used_ts
+            self.used.move_to_end(story.fingerprint)
+            # Drop the oldest entries past capacity or past the TTL
+            while self.used and (
+                len(self.used) > self.capacity
+                or used_ts - next(iter(self.used.values())) >= self.ttl
+            ):
+                self.used.popitem(last=False)
+        self.store.mark_used(story.canonical_url, used_ts)
+
+def _keyword_ids(keywords):
+    """Sorted 32-bit IDs for a keyword set, capped at TOPIC_MAX_KEYWORDS."""
+    ids = sorted({
+        int.from_bytes(hashlib.blake2b(word.encode(), digest_size=4).digest(), "little")
+        for word in keywords
+    })
+    return ids[:TOPIC_MAX_KEYWORDS]
+
+class TopicIndex:
+    """Near-duplicate index over the keyword sets of recently posted stories.
+
+    Each keyword set is hashed to 32-bit IDs and gets a MinHash signature,
+    split into LSH bands. A query only compares against stories sharing at
+    least one band bucket, so a novelty check costs about the same whether
+    history holds fifty stories or thousands. Candidates are confirmed with
+    an exact Jaccard over the IDs.
+
+    Every story added is appended to a file of fixed-size packed records
+    (signature plus keyword IDs), which is memory-mapped on startup, so
+    the history survives restarts without re-tokenizing anything.
+    """
+    PRIME = (1 << 31) - 1
+
+    def __init__(self, path=TOPIC_HISTORY_FILE, capacity=TOPIC_HISTORY_SIZE,
+                 threshold=TOPIC_SIMILARITY_THRESHOLD, bands=MINHASH_BANDS, rows=MINHASH_ROWS):
+        self.path = path
+        self.capacity = capacity
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = rows
+        # Fixed seed so signatures are stable across restarts
+        rng = random.Random(0x5E7A)
+        self.a = np.array([rng.randrange(1, self.PRIME) for _ in range(bands * rows)], dtype=np.uint64)
+        self.b = np.array([rng.randrange(0, self.PRIME) for _ in range(bands * rows)], dtype=np.uint64)
+        self.record = np.dtype([
+            ("signature", "<u4", (bands * rows,)),
+            ("count", "<u2"),
+            ("keywords", "<u4", (TOPIC_MAX_KEYWORDS,))
+        ])
+        self.entries = OrderedDict()  # id -> (keyword IDs, band keys), oldest first
+        self.buckets = defaultdict(set)  # (band, band signature) -> ids
+        self.next_id = 0
+        self.records_on_disk = 0
+        self.lock = threading.Lock()
+        self._load()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _signature(self, ids):
+        # IDs and coefficients are below 2**31, so a * h + b can't overflow uint64
+        hashes = np.asarray(ids, dtype=np.uint64) % self.PRIME
+        return ((np.outer(hashes, self.a) + self.b) % self.PRIME).min(axis=0).astype(np.uint32)
+
+    def _band_keys(self, signatures):
+        """64-bit bucket keys (one per band) for each row of a (stories x signature) array"""
+        rows = signatures.reshape(len(signatures), self.bands, self.rows).astype(np.uint64)
+        keys = np.broadcast_to(np.arange(self.bands, dtype=np.uint64), rows.shape[:2])
+        for row in range(self.rows):
+            # Multiplicative mixing; uint64 arithmetic wraps around
+            keys = keys * np.uint64(0x9E3779B97F4A7C15) + rows[:, :, row]
+        return keys.tolist()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            count = os.path.getsize(self.path) // self.record.itemsize
+            if not count:
+                return
+            records = np.memmap(self.path, dtype=self.record, mode="r", shape=(count,))[-self.capacity:]
+            band_keys = self._band_keys(records["signature"])
+            for keywords, size, keys in zip(records["keywords"].tolist(), records["count"].tolist(), band_keys):
+                self._insert(frozenset(keywords[:size]), keys)
+            self.records_on_disk = count
+            print(f"Loaded {len(self.entries)} topic fingerprints")
+        except Exception as e:
+            print(f"Error loading topic history: {e}")
+
+    def _insert(self, ids, band_keys):
+        entry_id = self.next_id
+        self.next_id += 1
+        self.entries[entry_id] = (ids, band_keys)
+        for key in band_keys:
+            self.buckets[key].add(entry_id)
+        while len(self.entries) > self.capacity:
+            old_id, (_, old_keys) = self.entries.popitem(last=False)
+            for key in old_keys:
+                bucket = self.buckets[key]
+                bucket.discard(old_id)
+                if not bucket:
+                    del self.buckets[key]
+
+    def _append(self, record):
+        if not self.path:
+            return
+        try:
+            with open(self.path, "ab") as f:
+                f.write(record.tobytes())
+            self.records_on_disk += 1
+            # Compact once the file holds twice what we keep
+            if self.records_on_disk > 2 * self.capacity:
+                records = np.fromfile(self.path, dtype=self.record)[-self.capacity:]
+                tmp_path = f"{self.path}.tmp"
+                records.tofile(tmp_path)
+                os.replace(tmp_path, self.path)
+                self.records_on_disk = len(records)
+        except Exception as e:
+            print(f"Error saving topic history: {e}")
+
+    def _max_similarity(self, ids, band_keys):
+        candidates = set()
+        for key in band_keys:
+            candidates |= self.buckets.get(key, set())
+        best = 0.0
+        for entry_id in candidates:
+            other = self.entries[entry_id][0]
+            best = max(best, len(ids & other) / len(ids | other))
+        return best
+
+    def is_similar(self, keywords):
+        """True if keywords closely match a story in the history"""
+        return self.similarities([keywords], lambda keywords: keywords)[0] > self.threshold
+
+    def similarities(self, items, keywords_of):
+        """Highest keyword Jaccard of each item (via keywords_of) against the history.
+
+        Only stories sharing an LSH bucket are compared, so weak overlaps
+        well under the threshold read as 0.
+        """
+        keyed = [_keyword_ids(keywords_of(item)) for item in items]
+        present = [ids for ids in keyed if ids]
+        band_keys = iter(self._band_keys(np.array([self._signature(ids) for ids in present]))) if present else None
+        keyed = [(frozenset(ids), next(band_keys)) if ids else None for ids in keyed]
+        with self.lock:
+            return [self._max_similarity(*entry) if entry else 0.0 for entry in keyed]
+
+    def filter_novel(self, items, keywords_of):
+        """Return the items whose keywords (via keywords_of) don't match the history"""
+        return [
+            item for item, similarity in zip(items, self.similarities(items, keywords_of))
+            if similarity <= self.threshold
+        ]
+
+    def add(self, keywords):
+        """Remember a posted story's keywords, evicting the oldest past capacity"""
+        ids = _keyword_ids(keywords)
+        if not ids:
+            return
+        record = np.zeros(1, dtype=self.record)
+        record["signature"] = self._signature(ids)
+        record["count"] = len(ids)
+        record["keywords"][0, :len(ids)] = ids
+        with self.lock:
+            self._insert(frozenset(ids), self._band_keys(record["signature"])[0])
+            self._append(record)
+
 class EncryptionManager:
     def __init__(self):
         self.key = None
@@ -305,17 +1601,220 @@ class EncryptionManager:
 if __name__ == "__main__":
     manager = EncryptionManager()
 
+def _cluster_stories(stories):
+    """Group stories about the same event and return one representative per group.
+
+    Each story's title and preview become a hashed TF-IDF vector; stories
+    whose cosine similarity passes CLUSTER_SIMILARITY are linked, and each
+    connected group is one event. The representative is the newest primary
+    source in the group (or the newest story if none is primary), and its
+    cluster_size counts every outlet that carried the event. Representatives
+    come back newest first.
+    """
+    if len(stories) < 2:
+        return list(stories)
+
+    # Sparse term-frequency matrix over hashed tokens
+    rows, cols = [], []
+    for i, story in enumerate(stories):
+        tokens = re.findall(r'\w{3,}', f"{story.title} {story.preview}".lower())
+        rows.extend([i] * len(tokens))
+        cols.extend(hash(token) & (CLUSTER_FEATURES - 1) for token in tokens)
+    rows = np.asarray(rows, dtype=np.int32)
+    cols = np.asarray(cols, dtype=np.int64)
+    n = len(stories)
+
+    if SCIPY_AVAILABLE:
+        tf = sparse.csr_matrix((np.ones(len(rows), dtype=np.float32), (rows, cols)), shape=(n, CLUSTER_FEATURES))
+        tf.sum_duplicates()
+        tf.data = 1 + np.log(tf.data)
+        df = np.bincount(tf.indices, minlength=CLUSTER_FEATURES)
+        idf = np.log((1 + n) / (1 + df)).astype(np.float32) + 1
+        vectors = tf.multiply(idf.reshape(1, -1)).tocsr()
+        norms = np.sqrt(np.asarray(vectors.multiply(vectors).sum(axis=1)).ravel())
+        vectors = sparse.diags(1 / np.maximum(norms, 1e-9)).dot(vectors)
+        similar = vectors.dot(vectors.T)
+        similar.data = (similar.data > CLUSTER_SIMILARITY).astype(np.int8)
+        similar.eliminate_zeros()
+        _, labels = connected_components(similar, directed=False)
+    else:
+        tf = np.zeros((n, CLUSTER_FEATURES), dtype=np.float32)
+        np.add.at(tf, (rows, cols), 1)
+        present = tf > 0
+        tf[present] = 1 + np.log(tf[present])
+        idf = np.log((1 + n) / (1 + present.sum(axis=0))) + 1
+        vectors = tf * idf
+        vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-9)
+        similar = np.triu((vectors @ vectors.T) > CLUSTER_SIMILARITY, 1)
+        # Union-find over the linked pairs
+        parent = list(range(n))
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        for i, j in zip(*np.nonzero(similar)):
+            parent[find(int(i))] = find(int(j))
+        labels = np.array([find(i) for i in range(n)])
+
+    clusters = defaultdict(list)
+    for label, story in zip(labels.tolist(), stories):
+        clusters[label].append(story)
+
+    representatives = []
+    for members in clusters.values():
+        best = max(members, key=lambda story: (story.tier == "primary", story.published_ts))
+        best.cluster_size = sum(story.coverage for story in members)
+        representatives.append(best)
+    representatives.sort(key=lambda story: story.published_ts, reverse=True)
+    return representatives
+
+def _score_stories(stories, similarities, weights=RANKING_WEIGHTS):
+    """Score a candidate pool in one vectorized pass.
+
+    Each signal is scaled to 0..1: recency decays with a half-life, source
+    is the tier weight relative to PRIMARY_FEED_WEIGHT, novelty is one minus
+    the closest match against recent posts, and coverage is the log of the
+    story's cluster size relative to the pool's widest. Returns the weighted
+    total per story and the weighted per-signal arrays.
+    """
+    n = len(stories)
+    now = time.time()
+    ages = (now - np.fromiter((story.published_ts for story in stories), np.float64, n)) / 3600
+    primary = np.fromiter((story.tier == "primary" for story in stories), bool, n)
+    extra_outlets = np.fromiter((story.cluster_size for story in stories), np.float64, n) - 1
+
+    signals = {
+        "recency": 0.5 ** (np.maximum(ages, 0) / RECENCY_HALF_LIFE_HOURS),
+        "source": np.where(primary, PRIMARY_FEED_WEIGHT, 1.0) / PRIMARY_FEED_WEIGHT,
+        "novelty": 1 - np.asarray(similarities, dtype=np.float64),
+        "coverage": np.log1p(extra_outlets) / np.log1p(max(extra_outlets.max(initial=0), 1)),
+    }
+    components = {name: weights.get(name, 0) * values for name, values in signals.items()}
+    scores = np.sum(list(components.values()), axis=0)
+    return scores, components
+
+def _clean_tweet_text(text):
+    """Strip whitespace and any quotation marks wrapping a generated tweet."""
+    text = (text or "").strip()
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in ('"', "'"):
+        text = text[1:-1].strip()
+    return text
+
+def _tweet_length(text):
+    """Length of text as X counts it.
+
+    Links count as TWEET_URL_LENGTH, emoji (including joined sequences) as
+    two, code points in TWEET_LIGHT_RANGES as one, and everything else,
+    CJK included, as two.
+    """
+    text = unicodedata.normalize("NFC", text or "")
+    length = TWEET_URL_LENGTH * len(TWEET_URL_PATTERN.findall(text))
+    text = TWEET_URL_PATTERN.sub("", text)
+    length += 2 * len(TWEET_EMOJI_PATTERN.findall(text))
+    text = TWEET_EMOJI_PATTERN.sub("", text)
+    for char in text:
+        code = ord(char)
+        length += 1 if any(low <= code <= high for low, high in TWEET_LIGHT_RANGES) else 2
+    return length
+
+def _pick_tweet(candidates, max_length):
+    """The longest non-empty draft within max_length, or None if none fits."""
+    fitting = [text for text in candidates if text and _tweet_length(text) <= max_length]
+    return max(fitting, key=_tweet_length) if fitting else None
+
+def _rewrite(text, pattern, replacement):
+    """Apply a rewrite, keeping a capital first letter capital."""
+    def replace(match):
+        if replacement and match.group(0)[0].isupper():
+            return replacement[0].upper() + replacement[1:]
+        return replacement
+    return re.sub(pattern, replace, text, flags=re.I)
+
+def _shorten_tweet(text, max_length):
+    """Deterministically shorten a draft to fit max_length; may return "".
+
+    Tries, stopping as soon as the draft fits: collapsing whitespace,
+    contractions, dropping filler words, then keeping whole sentences
+    while they fit plus as many clauses of the next one as fit. Returns ""
+    when not even the first clause fits.
+    """
+    text = re.sub(r'\s+', ' ', text).strip()
+    for pattern, replacement in TWEET_CONTRACTIONS + TWEET_FILLER:
+        if _tweet_length(text) <= max_length:
+            return text
+        text = _rewrite(text, pattern, replacement)
+    if _tweet_length(text) <= max_length:
+        return text
+
+    # Keep whole sentences while they fit, then cut the first one that
+    # overflows at its last clause boundary that fits
+    kept = ""
+    for sentence in re.split(r'(?<=[.!?])\s+', text):
+        for clause in re.split(r'(?<=[,;:])\s+|\s+(?=[—–-]\s)', sentence):
+            candidate = f"{kept} {clause}" if kept else clause
+            if _tweet_length(_end_sentence(candidate)) > max_length:
+                return _end_sentence(kept)
+            kept = candidate
+    return _end_sentence(kept)
+
+def _end_sentence(text):
+    """Drop trailing clause punctuation and make sure text ends like a sentence."""
+    text = text.rstrip(",;:—–- ")
+    return text if not text or text[-1] in ".!?" else text + "."
+
+def _story_fingerprint(url):
+    """64-bit fingerprint of a story's canonical URL, used as its dedupe key."""
+    digest = hashlib.blake2b(_canonical_url(url).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'big')
+
 class CryptoArticle:
-    def __init__(self, title, preview, full_text, link, published_date):
+    """A normalized story, carried as-is from feed parsing through to tweeting.
+
+    Uses __slots__ so large candidate pools stay small in memory. The publish
+    time is kept as an epoch timestamp; published_date and time_since_pub are
+    derived from it on demand.
+    """
+    __slots__ = ('title', 'preview', 'full_text', 'link', 'published_ts', 'canonical_url',
+                 'fingerprint', 'source', 'feed_url', 'tier', 'subject', 'coverage', 'cluster_size',
+                 'score', 'score_breakdown')
+
+    def __init__(self, title, preview, full_text, link, published_date,
+                 source=None, feed_url=None, tier=None, subject=None, coverage=1):
         self.title = title
-        self.preview = preview
+        self.preview = preview or ""
         self.full_text = full_text
         self.link = link
-        self.published_date = published_date
-    
+        if isinstance(published_date, datetime):
+            published_date = published_date.timestamp()
+        self.published_ts = published_date
+        self.canonical_url = _canonical_url(link)
+        self.fingerprint = _story_fingerprint(link)
+        self.source = source
+        self.feed_url = feed_url
+        self.tier = tier
+        self.subject = subject
+        self.coverage = coverage  # how many feeds carried this story
+        self.cluster_size = coverage  # outlets covering the same event, set by clustering
+        self.score = None  # ranking score and its per-signal parts, set by ranking
+        self.score_breakdown = None
+
+    @property
+    def published_date(self):
+        return datetime.fromtimestamp(self.published_ts, tz=timezone.utc)
+
+    @property
+    def time_since_pub(self):
+        """Hours since the story was published"""
+        return (time.time() - self.published_ts) / 3600
+
     def get_topic_text(self):
         return f"{self.title}\n\n{self.preview}"
 
+    def get_display_text(self):
+        """Text shown in the UI topic box; generate_tweet can parse it back"""
+        return f"{self.get_topic_text()}\n\nRead more: {self.link}"
+
 class TwitterBot:
     def __init__(self):
         print("\n=== Initializing TwitterBot ===")
@@ -329,11 +1828,20 @@ class TwitterBot:
         self.tweet_queue = queue.Queue()
         self.tweet_count = 0
         self.last_tweet_time = None
-        self.used_stories = set()  # Track used story URLs
-        self.recent_topics = []    # Track recent topic keywords
-        self.MAX_RECENT_TOPICS = 50  # Keep track of last 50 topics
-        self.feed_errors = defaultdict(int)  # Track feed errors
+        self.topic_index = TopicIndex()  # Keywords of recently posted stories
+        self.ranking_weights = dict(RANKING_WEIGHTS)  # Signal weights used to score candidates
+        self.feed_breaker = FeedCircuitBreaker()  # Skips failing/slow feeds, persisted
+        self.feed_poller = FeedPollScheduler()  # Polls each feed as often as it publishes
+        self.feed_errors = self.feed_breaker.failures  # Track feed errors
         self.feed_last_used = {}  # Track when each feed was last used
+        self.feed_cache = FeedCache()  # Conditional GET validators + parsed entries
+        self.story_store = StoryStore()  # Ingested stories, survives restarts
+        self.used_stories = UsedStoryLog(self.story_store)  # Posted story fingerprints, survives restarts
+        self.arxiv = ArxivClient()  # Batched arXiv queries + paper cache
+        self.article_cache = TTLCache(ARTICLE_CACHE_SIZE, ARTICLE_CACHE_TTL)  # url -> extracted text
+        self.story_pools = {}  # subject -> ranked candidates kept warm by the prefetcher
+        self.story_pool_lock = threading.Lock()
+        self.prefetcher_running = False
         self.last_successful_tweet = None
         self.twitter_client = None  # Initialize Twitter client as None
         self.backoff_until = None
@@ -359,8 +1867,15 @@ class TwitterBot:
         self.characters = self.load_characters()
         print(f"Loaded characters: {json.dumps(self.characters, indent=2)}")
         
+        self.load_custom_feeds()
         self.feed_config = self.load_feed_config()
         print(f"Loaded feed configuration: {json.dumps(self.feed_config, indent=2)}")
+
+        # Seed the topic history from the story store the first time round
+        if not len(self.topic_index):
+            for story in reversed(self.story_store.recent_used(TOPIC_HISTORY_SIZE)):
+                self.topic_index.add(self.extract_keywords(f"{story['title']} {story['preview']}"))
+        print(f"Restored {len(self.used_stories)} recently used stories")
         
         # Initialize clients
         if self.credentials.get('openai_key'):
@@ -463,25 +1978,23 @@ class TwitterBot:
                     print("\n⏰ 4 hours passed — preparing to send next tweet...")
 
                     if not self.tweet_queue.empty():
-                        character, story_text, subject = self.tweet_queue.get()
-                        tweet_text = self.generate_tweet(character, story_text)
+                        character, story, subject = self.tweet_queue.get()
+                        tweet_text = self.generate_tweet(character, story)
                         if tweet_text and self.send_tweet(tweet_text):
                             print("✅ Tweet from queue sent.")
                             self.last_successful_tweet = datetime.now()
 
                             # Queue up the next story
-                            next_story = self.get_new_story(subject)
+                            next_story = self.get_new_story(subject, budget=SCHEDULER_STORY_BUDGET)
                             if next_story:
-                                next_text = f"{next_story['title']}\n\n{next_story.get('preview','')}\n\nRead more: {next_story['url']}"
-                                self.tweet_queue.put((character, next_text, subject))
+                                self.tweet_queue.put((character, next_story, subject))
                         else:
                             print("❌ Failed to send tweet from queue.")
                     else:
                         print("📭 Tweet queue is empty — trying to refill...")
-                        next_story = self.get_new_story(self.scheduler_subject)
+                        next_story = self.get_new_story(self.scheduler_subject, budget=SCHEDULER_STORY_BUDGET)
                         if next_story:
-                            next_text = f"{next_story['title']}\n\n{next_story.get('preview','')}\n\nRead more: {next_story['url']}"
-                            self.tweet_queue.put((self.scheduler_character, next_text, self.scheduler_subject))
+                            self.tweet_queue.put((self.scheduler_character, next_story, self.scheduler_subject))
                             print("📥 Refilled tweet queue with a new story.")
                         else:
                             print("❌ Failed to get a new story. Queue remains empty.")
@@ -493,16 +2006,53 @@ class TwitterBot:
                 time.sleep(60)
 
         
-    def get_random_story_all(self, *args, **kwargs):
-        """
-        Compatibility alias so get_new_story() can call this.
-        Routes to the existing get_random_story(...) if present.
+    def get_random_story_all(self, budget=None):
+        """Surprise pick: race every subject at once and take the first story found.
+
+        Subjects are submitted in random order, so with warm pools the winner is
+        effectively random. Once one subject comes up with a story, feed work
+        still in flight for the others is cancelled. If the budget runs out
+        first, the best stored story of the first subject that has one wins.
         """
-        if hasattr(self, "get_random_story"):
-            return self.get_random_story(*args, **kwargs)
-        # Fallback: nothing else to delegate to
-        print("[get_random_story_all] No get_random_story(...) found; returning None.")
-        return None
+        deadline = None if budget is None else time.monotonic() + budget
+        subjects = list(RSS_FEEDS.keys())  # e.g. ["crypto", "ai", "tech"]
+        random.shuffle(subjects)
+
+        cancel = threading.Event()
+        pool = ThreadPoolExecutor(max_workers=len(subjects))
+        futures = {pool.submit(self.find_story, s, deadline, cancel): s for s in subjects}
+        selected = None
+        timed_out = False
+        try:
+            timeout = None if deadline is None else max(0, deadline - time.monotonic())
+            for future in as_completed(futures, timeout=timeout):
+                try:
+                    selected = future.result()
+                except Exception as e:
+                    print(f"❌ Error finding a story for {futures[future]}: {e}")
+                    continue
+                if selected:
+                    break
+        except FuturesTimeoutError:
+            print("⏱️ Surprise pick ran out of time")
+            timed_out = True
+        finally:
+            cancel.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        if not selected and timed_out:
+            # The fetches stop at the same deadline as the race, so no subject
+            # got to rank its candidates; fall back to what the store already
+            # holds, which needs no network I/O
+            for subject in subjects:
+                entries = self.rank_candidates(subject)
+                if entries:
+                    selected = random.choice(entries[:5])
+                    break
+
+        if not selected:
+            return None
+        return self.commit_story(selected)
 
     def load_credentials(self):
         print("\nLoading credentials...")
@@ -584,7 +2134,7 @@ class TwitterBot:
             url = f"https://api.openai.com/v1/assistants/{assistant_id}"
 
             print(f"Fetching assistant from URL: {url}")  # Log the URL
-            response = httpx.get(url, headers=headers)
+            response = http_transport.get(url, headers=headers)
 
             print(f"Response status code: {response.status_code}") # Log status code
             print(f"Response headers: {response.headers}") # Log headers
@@ -701,93 +2251,84 @@ class TwitterBot:
             return False
     
     def get_article_content(self, url):
+        """Return the visible text of an article page, downloading at most ARTICLE_MAX_BYTES"""
+        cached = self.article_cache.get(url)
+        if cached is not None:
+            return cached
         try:
-            response = requests.get(url, timeout=10)
-            soup = BeautifulSoup(response.text, 'html.parser')
-            for script in soup(["script", "style"]):
-                script.decompose()
-            text = soup.get_text(separator='\n', strip=True)
-            return text
-        except:
+            chunks = []
+            size = 0
+            with http_transport.stream("GET", url) as response:
+                content_type = response.headers.get("Content-Type", "")
+                if content_type and "html" not in content_type and "xml" not in content_type:
+                    print(f"Skipping non-HTML article ({content_type}): {url}")
+                    return ""
+                for chunk in response.iter_bytes():
+                    chunks.append(chunk)
+                    size += len(chunk)
+                    if size >= ARTICLE_MAX_BYTES:
+                        print(f"Article exceeded {ARTICLE_MAX_BYTES} bytes, truncating: {url}")
+                        break
+            text = run_parser(_extract_article_text, b"".join(chunks)[:ARTICLE_MAX_BYTES])
+        except Exception as e:
+            print(f"Error fetching article content: {e}")
             return ""
+        self.article_cache.set(url, text)
+        return text
 
     def extract_keywords(self, text):
         """Extract important keywords from text to track topic diversity"""
-        # Common crypto terms to ignore
-        common_terms = {'crypto', 'blockchain', 'bitcoin', 'ethereum', 'btc', 'eth', 
-                       'cryptocurrency', 'cryptocurrencies', 'token', 'tokens', 'defi',
-                       'market', 'markets', 'trading', 'price', 'prices'}
-        
         # Split into words and clean
-        words = re.findall(r'\b\w+\b', text.lower())
+        words = KEYWORD_PATTERN.findall(text.lower())
         # Remove common terms, short words, and numbers
         keywords = {word for word in words 
-                   if word not in common_terms 
+                   if word not in KEYWORD_STOPWORDS 
                    and len(word) > 3 
                    and not word.isdigit()}
         return keywords
 
     def is_similar_to_recent(self, title, preview):
         """Check if a story is too similar to recently posted ones"""
-        # Extract keywords from new story
-        new_keywords = self.extract_keywords(f"{title} {preview}")
-        
-        # Compare with recent topics
-        for recent_keywords in self.recent_topics:
-            # If more than 40% of keywords overlap, consider it too similar
-            overlap = len(new_keywords & recent_keywords) / len(new_keywords | recent_keywords)
-            if overlap > 0.4:
-                return True
-        return False
+        # If more than 40% of keywords overlap with a recent story, consider it too similar
+        return self.topic_index.is_similar(self.extract_keywords(f"{title} {preview}"))
+
+    def filter_novel_stories(self, stories):
+        """Drop stories too similar to recently posted ones, checking the whole batch at once"""
+        return self.topic_index.filter_novel(
+            stories, lambda story: self.extract_keywords(f"{story.title} {story.preview}")
+        )
 
     def get_arxiv_paper_details(self, url):
         """Get detailed information about an arXiv paper including abstract and authors."""
-        try:
-            # Convert URL to API URL
+        return self.get_arxiv_papers_details([url]).get(url)
+
+    def get_arxiv_papers_details(self, urls):
+        """Get details for many arXiv papers at once, keyed by the URL passed in."""
+        paper_ids = {}
+        for url in urls:
+            # Convert URL to paper ID
             paper_id = url.split('/')[-1]
             if 'arxiv.org/abs/' in url:
                 paper_id = url.split('arxiv.org/abs/')[-1]
             elif 'arxiv.org/pdf/' in url:
                 paper_id = url.split('arxiv.org/pdf/')[-1].replace('.pdf', '')
-            
-            api_url = f"http://export.arxiv.org/api/query?id_list={paper_id}"
-            
-            response = requests.get(api_url, timeout=FEED_TIMEOUT)
-            response.raise_for_status()
-            
-            # Parse the XML response
-            from xml.etree import ElementTree
-            root = ElementTree.fromstring(response.content)
-            
-            # arXiv API uses namespaces
-            ns = {
-                'atom': 'http://www.w3.org/2005/Atom',
-                'arxiv': 'http://arxiv.org/schemas/atom'
-            }
-            
-            entry = root.find('.//atom:entry', ns)
-            if entry is not None:
-                abstract = entry.find('atom:summary', ns).text.strip()
-                authors = [author.find('atom:name', ns).text for author in entry.findall('atom:author', ns)]
-                categories = [cat.get('term') for cat in entry.findall('atom:category', ns)]
-                
-                # Get HTML link (not PDF) for better preview cards
-                links = entry.findall('atom:link', ns)
-                html_url = next((link.get('href') for link in links if link.get('type') == 'text/html'), None)
-                if not html_url:
-                    # Construct HTML URL from paper ID
-                    html_url = f"https://arxiv.org/abs/{paper_id}"
-                
-                return {
-                    'abstract': abstract,
-                    'authors': authors,
-                    'categories': categories,
-                    'html_url': html_url,
-                    'paper_id': paper_id
-                }
+            paper_ids[url] = paper_id
+
+        try:
+            details = self.arxiv.get_details(list(paper_ids.values()))
         except Exception as e:
             print(f"Error fetching arXiv paper details: {e}")
-        return None
+            return {}
+        return {
+            url: {
+                'abstract': details[paper_id]['abstract'],
+                'authors': details[paper_id]['authors'],
+                'categories': details[paper_id]['categories'],
+                'html_url': details[paper_id]['html_url'],
+                'paper_id': paper_id
+            }
+            for url, paper_id in paper_ids.items() if paper_id in details
+        }
 
     def load_feed_config(self):
         """Load feed configuration from file"""
@@ -811,16 +2352,313 @@ class TwitterBot:
             print(f"Error saving feed configuration: {e}")
             return False
     
-    def get_new_story(self, subject):
-        """Get a new story from RSS feeds based on subject"""
+    def load_custom_feeds(self):
+        """Merge feeds imported from OPML into RSS_FEEDS"""
+        try:
+            if not os.path.exists(CUSTOM_FEEDS_FILE):
+                return
+            with open(CUSTOM_FEEDS_FILE, 'r') as f:
+                custom = json.load(f)
+            added = 0
+            for subject, tiers in custom.items():
+                for tier, feeds in tiers.items():
+                    added += self._add_feeds(subject, tier, feeds)
+            print(f"Loaded {added} imported feeds")
+        except Exception as e:
+            print(f"Error loading imported feeds: {e}")
+
+    def _add_feeds(self, subject, tier, feeds):
+        """Add feeds to RSS_FEEDS[subject][tier], skipping URLs already configured"""
+        subject_feeds = RSS_FEEDS.setdefault(subject, {"primary": [], "secondary": []})
+        known = {
+            _canonical_url(feed["url"])
+            for tier_feeds in subject_feeds.values() for feed in tier_feeds
+        }
+        added = 0
+        for feed in feeds:
+            if _canonical_url(feed["url"]) in known:
+                continue
+            known.add(_canonical_url(feed["url"]))
+            subject_feeds.setdefault(tier, []).append({"url": feed["url"], "name": feed["name"]})
+            added += 1
+        return added
+
+    def save_custom_feeds(self, subject, tier, feeds):
+        """Persist imported feeds so they are merged again on the next start"""
+        try:
+            custom = {}
+            if os.path.exists(CUSTOM_FEEDS_FILE):
+                with open(CUSTOM_FEEDS_FILE, 'r') as f:
+                    custom = json.load(f)
+            custom.setdefault(subject, {}).setdefault(tier, []).extend(feeds)
+            with open(CUSTOM_FEEDS_FILE, 'w') as f:
+                json.dump(custom, f, indent=2)
+            return True
+        except Exception as e:
+            print(f"Error saving imported feeds: {e}")
+            return False
 
-        # --- Handle Surprise/unknown subjects up front ---
-        if subject in ("__surprise_all__", "surprise", "random", None, ""):
-            return self.get_random_story_all()
-        if subject not in RSS_FEEDS:
-            print(f"⚠️ Unknown subject '{subject}'. Falling back to random.")
-            return self.get_random_story_all()
+    def validate_feed(self, feed):
+        """Probe a candidate feed once and measure whether it is fit for the hot path.
+
+        Returns a report with reachability, response time, payload size,
+        parse time and publish rate, plus a verdict: "ok", "downrank" (slow
+        or rarely updated) or "reject" (unreachable, oversized, unparseable
+        or stale).
+        """
+        report = {"url": feed["url"], "name": feed["name"], "verdict": "reject", "reason": None}
+        started = time.monotonic()
+        try:
+            body = bytearray()
+            with http_transport.stream("GET", feed["url"]) as response:
+                response.raise_for_status()
+                for chunk in response.iter_bytes():
+                    body.extend(chunk)
+                    if len(body) > FEED_MAX_BYTES:
+                        break
+            report["elapsed"] = time.monotonic() - started
+            report["bytes"] = len(body)
+            if len(body) > FEED_MAX_BYTES:
+                report["reason"] = f"larger than {FEED_MAX_BYTES // 1024} KB"
+                return report
+
+            parse_started = time.monotonic()
+            entries = run_parser(_parse_feed_entries, bytes(body))
+            report["parse_seconds"] = time.monotonic() - parse_started
+        except Exception as e:
+            report["reason"] = f"unreachable: {e}"
+            return report
+
+        report["entries"] = len(entries)
+        if not entries:
+            report["reason"] = "no dated entries"
+            return report
+        timestamps = sorted(entry["published_ts"] for entry in entries)
+        age_hours = (time.time() - timestamps[-1]) / 3600
+        if age_hours > STORY_TIME_WINDOWS[-1]:
+            report["reason"] = f"newest entry is {age_hours / 24:.0f} days old"
+            return report
+        span_days = max((timestamps[-1] - timestamps[0]) / 86400, 1)
+        report["per_day"] = len(timestamps) / span_days
+
+        report["verdict"] = "ok"
+        if report["elapsed"] > FEED_SLOW_SECONDS:
+            report["verdict"], report["reason"] = "downrank", f"slow ({report['elapsed']:.1f}s)"
+        elif report["per_day"] < FEED_VALIDATION_MIN_DAILY:
+            report["verdict"], report["reason"] = "downrank", f"rarely updated ({report['per_day']:.2f}/day)"
+        return report
+
+    def import_opml(self, content, subject, tier="primary"):
+        """Import the feeds in an OPML document into a subject, validating them in parallel.
+
+        Feeds that pass go into the requested tier, downranked feeds go into
+        secondary, and rejected feeds are left out. Returns the per-feed
+        validation reports.
+        """
+        feeds = _parse_opml(content)
+        known = {
+            _canonical_url(feed["url"])
+            for tier_feeds in RSS_FEEDS.get(subject, {}).values() for feed in tier_feeds
+        }
+        feeds = [feed for feed in feeds if _canonical_url(feed["url"]) not in known]
+        if not feeds:
+            return []
+
+        reports = []
+        with ThreadPoolExecutor(max_workers=min(FEED_VALIDATION_WORKERS, len(feeds))) as pool:
+            futures = [pool.submit(self.validate_feed, feed) for feed in feeds]
+            for future in as_completed(futures):
+                reports.append(future.result())
+
+        accepted = {tier: [], "secondary": []}
+        for report in reports:
+            if report["verdict"] == "reject":
+                continue
+            target = tier if report["verdict"] == "ok" else "secondary"
+            accepted[target].append({"url": report["url"], "name": report["name"]})
+        for target, target_feeds in accepted.items():
+            if target_feeds:
+                self._add_feeds(subject, target, target_feeds)
+                self.save_custom_feeds(subject, target, target_feeds)
+
+        print(f"📥 OPML import for {subject}: "
+              f"{sum(r['verdict'] == 'ok' for r in reports)} ok, "
+              f"{sum(r['verdict'] == 'downrank' for r in reports)} downranked, "
+              f"{sum(r['verdict'] == 'reject' for r in reports)} rejected")
+        return reports
+
+    def fetch_feed_entries(self, feed, tier="primary", deadline=None, cancel=None):
+        """Download and parse a single feed into normalized story dicts.
+
+        Uses the feed cache for conditional GETs, so an unchanged feed costs a
+        304 round trip and no parsing. Changed feeds are parsed as they stream
+        in and the download stops once we have the newest entries, unless
+        parsing is offloaded to the process pool, which takes the whole
+        (capped) body.
+        """
+        url = feed["url"]
+        headers = self.feed_cache.conditional_headers(url)
+        with http_transport.stream("GET", url, headers=headers, timeout=_request_timeout(deadline)) as response:
+            entries = self.feed_cache.get_entries(url) if response.status_code == 304 else None
+            if entries is None:
+                response.raise_for_status()
+                if _parse_pool is not None:
+                    # Hand the (capped) raw body to a worker process to parse
+                    body = bytearray()
+                    for chunk in _until_deadline(response.iter_bytes(), deadline, cancel):
+                        body.extend(chunk)
+                        if len(body) >= FEED_MAX_BYTES:
+                            break
+                    entries = run_parser(_parse_feed_body, bytes(body[:FEED_MAX_BYTES]))
+                else:
+                    entries = _stream_parse_feed(_until_deadline(response.iter_bytes(), deadline, cancel))
+                self.feed_cache.store(
+                    url,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    entries
+                )
+
+        return [
+            CryptoArticle(
+                entry["title"], entry["preview"], None, entry["url"], entry["published_ts"],
+                source=feed.get("name", url), feed_url=url, tier=tier
+            )
+            for entry in entries
+        ]
 
+    def fetch_arxiv_feeds(self, feeds, deadline=None):
+        """Fetch several arXiv category feeds with one combined API request.
+
+        Papers are attributed back to the feed for their primary category (or
+        the first matching cross-listed one) so per-feed settings still apply.
+        Each feed keeps at most ARXIV_RESULTS_PER_CATEGORY papers, as its own
+        feed URL returned, so busy categories don't crowd out quiet ones.
+        """
+        by_category = {_arxiv_category(feed["url"]): (feed, tier) for feed, tier in feeds}
+        papers = self.arxiv.search_categories(list(by_category), ARXIV_RESULTS_PER_CATEGORY, deadline=deadline)
+
+        stories = []
+        kept = defaultdict(int)
+        seen_ids = set()
+        for paper in papers:
+            category = paper['primary_category']
+            if category not in by_category:
+                category = next((c for c in paper['categories'] if c in by_category), None)
+            if not category or not paper['title'] or not paper['published_ts']:
+                continue
+            # Follow-up queries can return a paper again; keep each feed to its own quota
+            if paper['paper_id'] in seen_ids or kept[category] >= ARXIV_RESULTS_PER_CATEGORY:
+                continue
+            seen_ids.add(paper['paper_id'])
+            kept[category] += 1
+            feed, tier = by_category[category]
+            stories.append(CryptoArticle(
+                paper['title'], _clean_preview(paper['abstract']), paper['abstract'],
+                paper['html_url'], paper['published_ts'],
+                source=feed.get("name", feed["url"]), feed_url=feed["url"], tier=tier
+            ))
+        return stories
+
+    def fetch_feeds(self, feeds, max_workers=FEED_FETCH_WORKERS, deadline=None, cancel=None):
+        """Fetch (feed, tier) pairs concurrently and return their merged entries.
+
+        A sweep costs about as long as the slowest feed rather than the sum of
+        all of them. Feeds whose circuit breaker is open are skipped; failing
+        or slow feeds are logged and counted against their breaker. If a
+        deadline (time.monotonic() value) passes or the cancel event is set,
+        fetches still in flight are abandoned and whatever arrived so far is
+        returned.
+        """
+        feeds = [(feed, tier) for feed, tier in feeds if self.feed_breaker.allow(feed["url"])]
+        if not feeds:
+            return []
+
+        # arXiv category polls are collapsed into a single request
+        arxiv_feeds = [(feed, tier) for feed, tier in feeds if _arxiv_category(feed["url"])]
+        jobs = [([(feed, tier)], self.fetch_feed_entries, (feed, tier, deadline, cancel))
+                for feed, tier in feeds if not _arxiv_category(feed["url"])]
+        if arxiv_feeds:
+            jobs.append((arxiv_feeds, self.fetch_arxiv_feeds, (arxiv_feeds, deadline)))
+
+        def timed_fetch(fetch, args):
+            # Time spent queued behind other requests isn't the feed being slow
+            _take_queue_time()
+            started = time.monotonic()
+            entries = fetch(*args)
+            return entries, time.monotonic() - started - _take_queue_time()
+
+        stories = []
+        seen_urls = set()
+        pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs))))
+        futures = {
+            pool.submit(timed_fetch, fetch, args): group
+            for group, fetch, args in jobs
+        }
+        pending = set(futures)
+        try:
+            while pending:
+                if cancel is not None and cancel.is_set():
+                    print(f"🛑 Story selection cancelled; abandoning {len(pending)} feed fetch(es)")
+                    break
+                timeout = FETCH_CANCEL_POLL if cancel is not None else None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        print(f"⏱️ Story selection budget ran out; abandoning {len(pending)} feed fetch(es)")
+                        break
+                    timeout = remaining if timeout is None else min(timeout, remaining)
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._merge_fetch_result(future, futures[future], stories, seen_urls, deadline)
+        finally:
+            # Don't wait for abandoned fetches; they stop at their own (shortened) timeouts
+            pool.shutdown(wait=False, cancel_futures=True)
+            # Abandoned fetches never report back, so free any probe slots they held
+            for future in pending:
+                for feed, _ in futures[future]:
+                    self.feed_breaker.release(feed["url"])
+
+        self.feed_breaker.save()
+        self.feed_poller.save()
+        self.feed_cache.save()
+        return stories
+
+    def _merge_fetch_result(self, future, group, stories, seen_urls, deadline=None):
+        """Record a finished fetch against its feeds' breaker/poller and merge its entries"""
+        try:
+            entries, elapsed = future.result()
+        except TimeoutError:
+            # Cut short by our own deadline, not the feed's fault
+            for feed, _ in group:
+                self.feed_breaker.release(feed["url"])
+            return
+        except Exception as e:
+            # Request timeouts are shortened to the budget left, so an httpx
+            # timeout right at the deadline is the budget running out too
+            if isinstance(e, httpx.TimeoutException) and _deadline_hit(deadline):
+                for feed, _ in group:
+                    self.feed_breaker.release(feed["url"])
+                return
+            for feed, tier in group:
+                print(f"Error fetching from {tier} feed {feed.get('url')}: {e}")
+                self.feed_breaker.record_failure(feed["url"])
+            return
+        for feed, tier in group:
+            self.feed_breaker.record_success(feed["url"], elapsed)
+            self.feed_poller.record_poll(
+                feed["url"],
+                [story.published_ts for story in entries if story.feed_url == feed["url"]]
+            )
+            self.feed_last_used[feed["url"]] = time.time()
+        for story in entries:
+            if story.fingerprint in seen_urls:
+                continue
+            seen_urls.add(story.fingerprint)
+            stories.append(story)
+
+    def get_enabled_feeds(self, subject):
+        """Return (feed, tier) pairs for the feeds enabled for a subject"""
         # Get enabled feeds based on configuration
         feed_config = self.feed_config.get(subject, {})
         subject_feeds = RSS_FEEDS.get(subject, {})
@@ -846,60 +2684,190 @@ class TwitterBot:
             print("ℹ️ No feeds enabled by config; falling back to all feeds for this subject.")
             primary_feeds, secondary_feeds = all_primary, all_secondary
 
-        # Time windows to try, in order of preference (in hours)
-        time_windows = [
-            {"hours": 24, "entries": []},   # Last 24 hours
-            {"hours": 48, "entries": []},   # Last 2 days
-            {"hours": 72, "entries": []},   # Last 3 days
-            {"hours": 120, "entries": []}   # Last 5 days
-        ]
+        return [(feed, "primary") for feed in primary_feeds] + \
+               [(feed, "secondary") for feed in secondary_feeds]
 
-        # Collect stories from all feeds for each time window
-        for time_window in time_windows:
-            # Try primary feeds first
-            for feed in primary_feeds:
-                try:
-                    stories = self.get_stories_from_feed(feed, time_window)
-                    if stories:
-                        time_window["entries"].extend(stories)
-                except Exception as e:
-                    print(f"Error fetching from primary feed {feed.get('url')}: {e}")
+    def refresh_subject(self, subject, feeds=None, deadline=None, cancel=None):
+        """Sweep a subject's due feeds into the story store.
+
+        Each feed is only fetched once its learned polling interval has
+        passed; feeds cut short by the deadline stay due for the next call.
+        With LAZY_SECONDARY_FEEDS, primary feeds are swept first and
+        secondary feeds only when the primaries don't have enough fresh
+        stories.
+        """
+        if deadline is not None and time.monotonic() >= deadline:
+            return
+        feeds = feeds if feeds is not None else self.get_enabled_feeds(subject)
+        if LAZY_SECONDARY_FEEDS:
+            primary = [(feed, tier) for feed, tier in feeds if tier == "primary"]
+            secondary = [(feed, tier) for feed, tier in feeds if tier != "primary"]
+            swept = self._sweep_feeds(subject, primary, deadline, cancel)
+            if secondary and self.needs_secondary_feeds(subject, primary):
+                swept = self._sweep_feeds(subject, secondary, deadline, cancel) or swept
+        else:
+            swept = self._sweep_feeds(subject, feeds, deadline, cancel)
+        if swept:
+            self.story_store.record_sweep(subject)
+
+    def needs_secondary_feeds(self, subject, primary_feeds):
+        """True unless the primary feeds already hold MIN_STORIES_PER_FEED fresh stories each"""
+        wanted = MIN_STORIES_PER_FEED * max(len(primary_feeds), 1)
+        fresh = self.story_store.count_candidates(
+            subject, SECONDARY_FRESH_HOURS, [feed["url"] for feed, _ in primary_feeds]
+        )
+        if fresh >= wanted:
+            print(f"Skipping secondary feeds for {subject}: {fresh} fresh primary stories")
+            return False
+        return True
+
+    def _sweep_feeds(self, subject, feeds, deadline=None, cancel=None):
+        """Fetch and ingest the due feeds among feeds; returns False if none were due"""
+        if deadline is not None and time.monotonic() >= deadline:
+            return False
+        if cancel is not None and cancel.is_set():
+            return False
+        due_feeds = [(feed, tier) for feed, tier in feeds if self.feed_poller.is_due(feed["url"])]
+        if not due_feeds:
+            return False
+        fetched = self.fetch_feeds(due_feeds, deadline=deadline, cancel=cancel)
+        if fetched:
+            new_count = self.story_store.ingest(subject, fetched)
+            print(f"Ingested {new_count} new stories for {subject} from {len(due_feeds)} due feed(s)")
+        return True
+
+    def rank_candidates(self, subject, feeds=None):
+        """Return unused stories from the narrowest non-empty time window, best score first"""
+        feeds = feeds if feeds is not None else self.get_enabled_feeds(subject)
+
+        # Stored candidates come back newest first, so each time window is
+        # just a prefix of the list
+        enabled_urls = [feed["url"] for feed, _ in feeds]
+        stories = self.story_store.candidates(subject, STORY_TIME_WINDOWS[-1], enabled_urls)
+        # The store filters posted stories too, but one may have been posted since the query
+        stories = [story for story in stories if story.fingerprint not in self.used_stories]
+        # One representative per event, so a widely covered event doesn't crowd the top picks
+        stories = _cluster_stories(stories)
+        if not stories:
+            return []
+
+        # Skip repeats of recently posted topics, unless that leaves nothing
+        similarities = self.topic_index.similarities(
+            stories, lambda story: self.extract_keywords(f"{story.title} {story.preview}")
+        )
+        novel = [i for i, similarity in enumerate(similarities) if similarity <= TOPIC_SIMILARITY_THRESHOLD]
+        if novel:
+            stories = [stories[i] for i in novel]
+            similarities = [similarities[i] for i in novel]
+        scores, components = _score_stories(stories, similarities, self.ranking_weights)
+        ages = [story.time_since_pub for story in stories]
+
+        # Try time windows in order of preference; wider windows cost no extra I/O
+        for hours in STORY_TIME_WINDOWS:
+            count = bisect_right(ages, hours)
+            if count:
+                print(f"\nFound {count} total stories for {subject} within {hours} hours")
+                entries = []
+                for i in np.argsort(-scores[:count], kind="stable").tolist():
+                    story = stories[i]
+                    story.score = float(scores[i])
+                    story.score_breakdown = {name: float(values[i]) for name, values in components.items()}
+                    entries.append(story)
+                return entries
+        return []
+
+    def start_prefetcher(self):
+        """Start the background thread that keeps per-subject candidate pools warm"""
+        if self.prefetcher_running:
+            return
+        self.prefetcher_running = True
+        threading.Thread(target=self.prefetch_worker, daemon=True).start()
 
-            # Then try secondary feeds
-            for feed in secondary_feeds:
+    def prefetch_worker(self):
+        print("\n📡 Starting story prefetcher...")
+        while self.prefetcher_running:
+            for subject in RSS_FEEDS:
                 try:
-                    stories = self.get_stories_from_feed(feed, time_window)
-                    if stories:
-                        time_window["entries"].extend(stories)
+                    feeds = self.get_enabled_feeds(subject)
+                    self.refresh_subject(subject, feeds)
+                    pool = self.rank_candidates(subject, feeds)[:PREFETCH_POOL_SIZE]
+                    with self.story_pool_lock:
+                        self.story_pools[subject] = pool
+                    print(f"📦 Prefetched {len(pool)} candidate stories for {subject}")
                 except Exception as e:
-                    print(f"Error fetching from secondary feed {feed.get('url')}: {e}")
-
-            # If we found stories in this time window, sort by recency and pick one
-            if time_window["entries"]:
-                print(f"\nFound {len(time_window['entries'])} total stories within {time_window['hours']} hours")
-                # Sort all entries by recency
-                time_window["entries"].sort(key=lambda x: x['time_since_pub'])
-                # Pick randomly from the most recent stories (up to 5)
-                selection_pool = time_window["entries"][:5]
-                selected = random.choice(selection_pool)
-
-                # Track this story
-                self.used_stories.add(selected['url'])
-                if len(self.used_stories) > 200:
-                    self.used_stories.pop()
-
-                # Track topic keywords
-                new_keywords = self.extract_keywords(f"{selected['title']} {selected['preview']}")
-                self.recent_topics.append(new_keywords)
-                if len(self.recent_topics) > self.MAX_RECENT_TOPICS:
-                    self.recent_topics.pop(0)
-
-                print(f"Selected story from {selected['source']}")
-                print(f"Title: {selected['title']}")
-                print(f"Published {selected['time_since_pub']:.1f} hours ago")
-                return selected
+                    print(f"❌ Error prefetching stories for {subject}: {e}")
+            time.sleep(PREFETCH_INTERVAL_MINUTES * 60)
 
-        return None
+    def pick_pooled_story(self, subject):
+        """Pick a story from the warm candidate pool, or None if the pool is empty.
+
+        The story stays in the pool until it is committed, at which point it
+        is filtered out as used.
+        """
+        with self.story_pool_lock:
+            pool = self.story_pools.get(subject, [])
+            # Drop anything posted, or a repeat of something posted, since the pool was built
+            pool[:] = self.filter_novel_stories(
+                [story for story in pool if story.fingerprint not in self.used_stories]
+            )
+            if not pool:
+                return None
+            # Pick randomly from the most recent stories (up to 5)
+            return random.choice(pool[:5])
+
+    def find_story(self, subject, deadline=None, cancel=None):
+        """Find a candidate story for a subject without marking it used"""
+        # Serve from the prefetched pool when it's warm; otherwise fall back to
+        # the store (sweeping any due feeds first)
+        selected = self.pick_pooled_story(subject)
+        if selected:
+            return selected
+        feeds = self.get_enabled_feeds(subject)
+        self.refresh_subject(subject, feeds, deadline=deadline, cancel=cancel)
+        if cancel is not None and cancel.is_set():
+            return None
+        entries = self.rank_candidates(subject, feeds)
+        if not entries:
+            return None
+        # Pick randomly from the most recent stories (up to 5)
+        return random.choice(entries[:5])
+
+    def commit_story(self, selected):
+        """Mark a selected story as used and remember its topic"""
+        # Track this story
+        self.used_stories.add(selected)
+
+        # Track topic keywords
+        self.topic_index.add(self.extract_keywords(f"{selected.title} {selected.preview}"))
+
+        print(f"Selected story from {selected.source}")
+        print(f"Title: {selected.title}")
+        print(f"Published {selected.time_since_pub:.1f} hours ago")
+        if selected.score is not None:
+            breakdown = ", ".join(f"{name} {value:.2f}" for name, value in selected.score_breakdown.items())
+            print(f"Score {selected.score:.2f} ({breakdown})")
+        return selected
+
+    def get_new_story(self, subject, budget=None):
+        """Get a new story from RSS feeds based on subject.
+
+        budget caps, in seconds, how long this may spend on feed I/O. When it
+        runs out, in-flight fetches are abandoned and the best story already
+        in the pool or the story store is returned.
+        """
+        deadline = None if budget is None else time.monotonic() + budget
+
+        # --- Handle Surprise/unknown subjects up front ---
+        if subject in ("__surprise_all__", "surprise", "random", None, ""):
+            return self.get_random_story_all(budget=budget)
+        if subject not in RSS_FEEDS:
+            print(f"⚠️ Unknown subject '{subject}'. Falling back to random.")
+            return self.get_random_story_all(budget=budget)
+
+        selected = self.find_story(subject, deadline=deadline)
+        if not selected:
+            return None
+        return self.commit_story(selected)
 
     def generate_tweet(self, character_name, topic):
         character = self.characters.get(character_name)
@@ -914,16 +2882,20 @@ class TwitterBot:
                 else:
                     return "Monthly tweet limit reached. Please wait for the next cycle."
 
-            # Extract URL if present in the topic
-            url_match = re.search(r'Read more: (https?://\S+)', topic)
-            article_url = url_match.group(1) if url_match else None
-            
-            # Remove the "Read more: URL" part from the topic
-            clean_topic = re.sub(r'\n\nRead more: https?://\S+', '', topic)
+            if isinstance(topic, CryptoArticle):
+                # Stories from the feeds already carry their URL
+                article_url = topic.link
+                clean_topic = topic.get_topic_text()
+            else:
+                # Extract URL if present in the topic
+                url_match = re.search(r'Read more: (https?://\S+)', topic)
+                article_url = url_match.group(1) if url_match else None
+
+                # Remove the "Read more: URL" part from the topic
+                clean_topic = re.sub(r'\n\nRead more: https?://\S+', '', topic)
 
-            # Calculate character limit
-            TWITTER_SHORT_URL_LENGTH = 24
-            max_content_length = 280 - TWITTER_SHORT_URL_LENGTH if article_url else 280
+            # Calculate character limit (weighted, as X counts it; the URL goes after a space)
+            max_content_length = TWEET_MAX_WEIGHTED_LENGTH - (TWEET_URL_LENGTH + 1 if article_url else 0)
 
             # 🔀 Add variation to prompt tone
             prompt_variants = [
@@ -951,25 +2923,25 @@ class TwitterBot:
                 {"role": "user", "content": f"{variation}\n\nCreate a tweet about this topic that is EXACTLY {max_content_length} characters or less. Make it engaging and maintain character voice. NO hashtags, emojis, or URLs - I'll add the URL later. Topic: {clean_topic}"}
             ]
 
+            # Ask for several drafts in one call and keep the best one that fits
             response = self.client.chat.completions.create(
                 model=character['model'],
                 messages=messages,
                 max_tokens=200,
                 temperature=1.0,
                 presence_penalty=0.6,
-                frequency_penalty=0.6
+                frequency_penalty=0.6,
+                n=TWEET_CANDIDATES
             )
-
-            tweet_text = response.choices[0].message.content.strip()
-
-            # Clean up quotation marks if present
-            if tweet_text and len(tweet_text) >= 2:
-                if (tweet_text[0] == '"' and tweet_text[-1] == '"') or \
-                (tweet_text[0] == "'" and tweet_text[-1] == "'"):
-                    tweet_text = tweet_text[1:-1].strip()
-
-            # If tweet content is too long, try one more time with stricter length
-            if len(tweet_text) > max_content_length:
+            candidates = [_clean_tweet_text(choice.message.content) for choice in response.choices]
+            tweet_text = _pick_tweet(candidates, max_content_length)
+            if tweet_text is None:
+                # No draft fits: shorten them locally and keep the longest result
+                tweet_text = max((_shorten_tweet(text, max_content_length) for text in candidates), key=_tweet_length)
+
+            # Last resort: a second call, only when no draft can be shortened to a whole clause
+            if not tweet_text:
+                print(f"⚠️ No draft fits in {max_content_length} characters; asking for a shorter one")
                 retry_messages = [
                     {"role": "system", "content": character['prompt']},
                     {"role": "user", "content": f"{variation}\n\nCreate a SHORTER tweet about this topic, maximum {max_content_length} characters. Be concise but maintain personality. NO hashtags, emojis, or URLs. Topic: {clean_topic}"}
@@ -982,22 +2954,15 @@ class TwitterBot:
                     presence_penalty=0.6,
                     frequency_penalty=0.6
                 )
-                tweet_text = response.choices[0].message.content.strip()
-                if tweet_text and len(tweet_text) >= 2:
-                    if (tweet_text[0] == '"' and tweet_text[-1] == '"') or \
-                    (tweet_text[0] == "'" and tweet_text[-1] == "'"):
-                        tweet_text = tweet_text[1:-1].strip()
-
-            # Truncate if still too long
-            if len(tweet_text) > max_content_length:
-                sentences = re.split(r'(?<=[.!?])\s+', tweet_text)
-                truncated_text = ""
-                for sentence in sentences:
-                    if len(truncated_text + sentence) + 1 <= max_content_length:
-                        truncated_text += " " + sentence if truncated_text else sentence
-                    else:
-                        break
-                tweet_text = truncated_text.strip()
+                tweet_text = _clean_tweet_text(response.choices[0].message.content)
+                if _tweet_length(tweet_text) > max_content_length:
+                    shortened = _shorten_tweet(tweet_text, max_content_length)
+                    while not shortened and tweet_text:
+                        # Not even one clause fits: drop words until it does
+                        tweet_text = tweet_text.rsplit(" ", 1)[0] if " " in tweet_text else tweet_text[:-1]
+                        if _tweet_length(tweet_text + "...") <= max_content_length:
+                            shortened = tweet_text + "..."
+                    tweet_text = shortened
 
             # Append the article URL at the end
             if article_url:
@@ -1108,10 +3073,9 @@ class TwitterBot:
 
     def send_main_tweet(self):
         """Send a main scheduled tweet."""
-        new_story = self.get_new_story("crypto")  # or "ai", depending on your subject
+        new_story = self.get_new_story("crypto", budget=SCHEDULER_STORY_BUDGET)  # or "ai", depending on your subject
         if new_story:
-            story_text = f"{new_story['title']}\n\n{new_story['preview']}\n\nRead more: {new_story['url']}"
-            tweet_text = self.generate_tweet("mork zuckerbarge", story_text)
+            tweet_text = self.generate_tweet("mork zuckerbarge", new_story)
             if tweet_text:
                 if self.send_tweet(tweet_text):
                     self.last_successful_tweet = datetime.now()
@@ -1396,12 +3360,10 @@ class TwitterBot:
         }
 
         try:
-            response = requests.post(url, data=payload)
+            response = http_transport.post(url, data=payload)
             print("📨 Telegram status:", response.status_code, response.text)
         except Exception as e:
             print(f"❌ Telegram send failed: {e}")
-    import requests  # Make sure you have this imported at top
-
     def monitor_and_reply_to_mentions(self):
         """Daily: fetch new mentions, pick best <=2 <23h old, reply; try backlog first."""
         try:
@@ -1443,7 +3405,7 @@ class TwitterBot:
                     text = self.generate_persona_reply_from_tweet_id(tid) if hasattr(self, "generate_persona_reply_from_tweet_id") else None
                     if not text:
                         # Fallback: fetch tweet text to pass to persona
-                        tw_resp = requests.get(
+                        tw_resp = http_transport.get(
                             "https://api.twitter.com/2/tweets",
                             headers=headers,
                             params={"ids": tid, "tweet.fields": "text"}
@@ -1491,7 +3453,7 @@ class TwitterBot:
             if state.get("since_id"):
                 params["since_id"] = state["since_id"]
 
-            resp = requests.get(url, headers=headers, params=params)
+            resp = http_transport.get(url, headers=headers, params=params)
             if resp.status_code != 200:
                 print(f"❌ Error fetching mentions: {resp.status_code} {resp.text}")
                 state["backlog"] = backlog  # keep backlog progress
@@ -1607,6 +3569,32 @@ def save_feed_selection(subject, primary_selected, secondary_selected):
         traceback.print_exc()
         return f"Error saving feed configuration: {str(e)}"
 
+def import_opml_file(file, subject, tier):
+    """Import an uploaded OPML file into the selected subject and summarize the result"""
+    if file is None:
+        return "Please choose an OPML file to import"
+    try:
+        path = getattr(file, "name", file)
+        with open(path, 'rb') as f:
+            reports = bot.import_opml(f.read(), subject, tier.lower())
+        if not reports:
+            return "No new feeds found in the OPML file"
+
+        lines = []
+        for report in sorted(reports, key=lambda r: ("ok", "downrank", "reject").index(r["verdict"])):
+            if report["verdict"] == "reject":
+                lines.append(f"❌ {report['name']}: {report['reason']}")
+                continue
+            stats = f"{report['elapsed']:.1f}s, {report['bytes'] // 1024} KB, {report['per_day']:.1f}/day"
+            if report["verdict"] == "downrank":
+                lines.append(f"⚠️ {report['name']} → secondary, {report['reason']} ({stats})")
+            else:
+                lines.append(f"✅ {report['name']} ({stats})")
+        return "\n".join(lines)
+    except Exception as e:
+        print(f"Error importing OPML: {e}")
+        return f"Error importing OPML: {str(e)}"
+
 def create_ui():
     print("\n=== Creating UI ===")
     global bot  # Make bot instance globally accessible
@@ -2091,18 +4079,15 @@ def create_ui():
 
                 def get_story_dispatch(subject):
                     if subject == "__surprise_all__":
-                        # Try subjects in random order; first successful story wins
-                        subjects = list(RSS_FEEDS.keys())  # e.g., ["crypto","ai","tech"]
-                        random.shuffle(subjects)
-                        for s in subjects:
-                            story = bot.get_new_story(s)
-                            if story:
-                                return f"{story['title']}\n\n{story['preview']}\n\nRead more: {story['url']} (source: {s})"
+                        # All subjects race; first successful story wins
+                        story = bot.get_random_story_all(budget=UI_STORY_BUDGET)
+                        if story:
+                            return f"{story.get_display_text()} (source: {story.subject})"
                         return "No items found right now. Try again in a moment."
                     # Normal per-subject path
-                    story = bot.get_new_story(subject)
+                    story = bot.get_new_story(subject, budget=UI_STORY_BUDGET)
                     if story:
-                        return f"{story['title']}\n\n{story['preview']}\n\nRead more: {story['url']}"
+                        return story.get_display_text()
                     return f"No items found for '{subject}' right now."
 
                 # IMPORTANT: Do NOT auto-fetch on selection.
@@ -2141,10 +4126,9 @@ def create_ui():
                                 bot.meme_counter = 0
                                 
                                 # Queue up first news story for next tweet
-                                new_story = bot.get_new_story(subject)
+                                new_story = bot.get_new_story(subject, budget=UI_STORY_BUDGET)
                                 if new_story:
-                                    story_text = f"{new_story['title']}\n\n{new_story['preview']}\n\nRead more: {new_story['url']}"
-                                    bot.tweet_queue.put((character, story_text, subject))
+                                    bot.tweet_queue.put((character, new_story, subject))
                                 
                                 # Start the worker thread
                                 threading.Thread(target=bot.scheduler_worker, daemon=True).start()
@@ -2154,22 +4138,20 @@ def create_ui():
                         print("Meme tweet failed, falling back to news")
                     
                     # If no memes or meme tweet failed, start with news
-                    new_story = bot.get_new_story(subject)
+                    new_story = bot.get_new_story(subject, budget=UI_STORY_BUDGET)
                     if not new_story:
                         bot.scheduler_running = False
                         return "Failed to fetch news story", "Scheduler: NOT RUNNING", current_topic.value
                         
-                    story_text = f"{new_story['title']}\n\n{new_story['preview']}\n\nRead more: {new_story['url']}"
+                    story_text = new_story.get_display_text()
                     
                     # Send first tweet
-                    tweet_text = bot.generate_tweet(character, story_text)
+                    tweet_text = bot.generate_tweet(character, new_story)
                     if tweet_text and bot.send_tweet(tweet_text):
                         # Queue up next story before starting worker
-                        next_story = bot.get_new_story(subject)
+                        next_story = bot.get_new_story(subject, budget=UI_STORY_BUDGET)
                         if next_story:
-                            # ✅ Fixed: use next_story['preview'] here
-                            next_story_text = f"{next_story['title']}\n\n{next_story['preview']}\n\nRead more: {next_story['url']}"
-                            bot.tweet_queue.put((character, next_story_text, subject))
+                            bot.tweet_queue.put((character, next_story, subject))
                         
                         # Start the worker thread
                         threading.Thread(target=bot.scheduler_worker, daemon=True).start()
@@ -2198,9 +4180,9 @@ def create_ui():
                 if tweet_text:
                     if bot.send_tweet(tweet_text):
                         if use_news.value:
-                            new_story = bot.get_new_story(subject_dropdown.value)
+                            new_story = bot.get_new_story(subject_dropdown.value, budget=UI_STORY_BUDGET)
                             if new_story:
-                                current_topic.value = f"{new_story['title']}\n\n{new_story['preview']}\n\nRead more: {new_story['url']}"
+                                current_topic.value = new_story.get_display_text()
                         return f"Tweet sent: {tweet_text}"
                     else:
                         return "Failed to send tweet. Please check your credentials."
@@ -2271,6 +4253,13 @@ def create_ui():
                 surprise_all_btn = gr.Button("🎲 Surprise me (All Feeds)")
                 save_feeds_status = gr.Textbox(label="Status", interactive=False)
 
+            gr.Markdown("### Import Feeds (OPML)")
+            with gr.Row():
+                opml_file = gr.File(label="OPML File", file_types=[".opml", ".xml"])
+                opml_tier = gr.Radio(label="Import As", choices=["Primary", "Secondary"], value="Secondary")
+                import_opml_btn = gr.Button("Validate & Import")
+            import_opml_status = gr.Textbox(label="Import Results", interactive=False, lines=8)
+
             # Wire subject dropdown to checkbox refresh
             feed_subject.change(
                 update_feed_checkboxes,
@@ -2278,6 +4267,17 @@ def create_ui():
                 outputs=[primary_feeds, secondary_feeds]
             )
 
+            # Import OPML, then show the new feeds in the checkbox groups
+            import_opml_btn.click(
+                import_opml_file,
+                inputs=[opml_file, feed_subject, opml_tier],
+                outputs=[import_opml_status]
+            ).then(
+                update_feed_checkboxes,
+                inputs=[feed_subject],
+                outputs=[primary_feeds, secondary_feeds]
+            )
+
             # Save config
             save_feeds_btn.click(
                 save_feed_selection,
@@ -2287,13 +4287,10 @@ def create_ui():
 
             # --- Random across ALL feeds helper ---
             def get_random_story_all():
-                # Try subjects in random order; first successful story wins
-                subjects = list(RSS_FEEDS.keys())
-                random.shuffle(subjects)
-                for subj in subjects:
-                    story = bot.get_new_story(subj)  # respects per-subject config inside your bot
-                    if story:
-                        return f"{story['title']}\n\n{story['preview']}\n\nRead more: {story['url']} (source: {subj})"
+                # All subjects race; first successful story wins (respects per-subject config)
+                story = bot.get_random_story_all(budget=UI_STORY_BUDGET)
+                if story:
+                    return f"{story.get_display_text()} (source: {story.subject})"
                 return "No items found right now. Try again in a moment."
 
             # Initialize feed checkboxes for default subject
@@ -2302,9 +4299,9 @@ def create_ui():
 
         # Simple helpers that already existed
         def get_story(subject):
-            story = bot.get_new_story(subject)
+            story = bot.get_new_story(subject, budget=UI_STORY_BUDGET)
             if story:
-                return f"{story['title']}\n\n{story['preview']}\n\nRead more: {story['url']}"
+                return story.get_display_text()
             return "Failed to fetch new story. Please try again."
 
         def send_tweet(character, topic):
@@ -2357,7 +4354,7 @@ def start_bot():
 bot = TwitterBot()
 def fetch_prompt_from_github(repo_url="https://raw.githubusercontent.com/Mork-Zuckerbarge/prime-directive/main/directive"):
     try:
-        response = requests.get(repo_url)
+        response = http_transport.get(repo_url)
         response.raise_for_status()
         print("✅ Prompt fetched from GitHub successfully.")
         return response.text.strip()
@@ -2391,7 +4388,13 @@ else:
 
 
 if __name__ == "__main__":
+    # Fork parsing workers before any background threads start
+    start_parse_pool()
+
     interface = create_ui()
+
+    # Keep candidate stories warm so posting never waits on feed I/O
+    bot.start_prefetcher()
     
     # Schedule Mork's haunting reply checker
     schedule.every().day.at("10:00").do(bot.monitor_and_reply_to_mentions)